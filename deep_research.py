@@ -27,6 +27,7 @@ The edge: Track improvements over time, not just snapshots.
 import sys
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -49,6 +50,11 @@ from research.options_analysis import OptionsAnalyzer, check_options
 from research.technical_analysis import TechnicalAnalyzer, check_technicals
 from research.competitors import CompetitorAnalyzer, compare_competitors
 from research.pdf_export import export_analysis_to_pdf
+from research.cache import load_info
+from research.alerts import get_last_prices
+
+# Analysis steps fetched concurrently in full_analysis
+ANALYSIS_WORKERS = 5
 
 
 def full_analysis(ticker: str, export_pdf: bool = False, pdf_output: str = None):
@@ -83,72 +89,86 @@ def full_analysis(ticker: str, export_pdf: bool = False, pdf_output: str = None)
     print(f"🔬 DEEP RESEARCH: {ticker}")
     print("═" * 70)
     
-    # 1. Business Understanding
-    print("\n📍 Step 1: Understanding the Business...")
-    business = BusinessAnalyzer(ticker)
-    business.analyze()
-    print(business.format_report())
-    
-    # 2. Fundamental Analysis
-    print("\n📍 Step 2: Analyzing Financials...")
-    fundamentals = FundamentalAnalyzer(ticker)
-    fundamentals.analyze()
-    print(fundamentals.format_report())
-    
-    # 3. Valuation Analysis
-    print("\n📍 Step 3: Valuation (Fair Value)...")
-    valuation = StockValuation(ticker)
-    val_summary = valuation.analyze()
-    print(valuation.format_report(val_summary))
-    
-    # 4. Insider Activity (real-time SEC data)
-    print("\n📍 Step 4: Insider Activity (SEC Form 4)...")
-    insider_tracker = InsiderTracker()
-    insider_summary = insider_tracker.get_insider_summary(ticker)
-    if insider_summary:
-        print(insider_tracker.format_summary(insider_summary))
-    else:
-        print("   No recent insider transactions found")
-    
-    # 5. Short Interest & Squeeze Risk
-    print("\n📍 Step 5: Short Interest...")
-    short_tracker = ShortInterestTracker()
-    short_data = short_tracker.get_short_interest(ticker)
-    if short_data:
-        print(short_tracker.format_report(short_data))
-    else:
-        print("   No short interest data available")
-    
-    # 6. Earnings History & Calendar
-    print("\n📍 Step 6: Earnings History...")
-    earnings_tracker = EarningsTracker(ticker)
-    earnings_summary = earnings_tracker.analyze()
-    print(earnings_tracker.format_report(earnings_summary))
-    
-    # 7. Dividends & Buybacks
-    print("\n📍 Step 7: Shareholder Returns...")
-    div_tracker = BuybackDividendTracker(ticker)
-    buyback_data = div_tracker.analyze_buybacks()
-    dividend_data = div_tracker.analyze_dividends()
-    print(div_tracker.format_report(buyback_data, dividend_data))
-    
-    # 8. Options IV & LEAPS Timing
-    print("\n📍 Step 8: Options Analysis...")
-    options_analyzer = OptionsAnalyzer(ticker)
-    options_data = options_analyzer.analyze()
-    print(options_analyzer.format_report(options_data))
-    
-    # 9. Technical Analysis
-    print("\n📍 Step 9: Technical Analysis...")
-    tech_analyzer = TechnicalAnalyzer(ticker)
-    tech_data = tech_analyzer.analyze()
-    print(tech_analyzer.format_report(tech_data))
-    
-    # 10. Peer Comparison
-    print("\n📍 Step 10: Peer Comparison...")
-    peer_analyzer = CompetitorAnalyzer(ticker)
-    peer_result = peer_analyzer.analyze()
-    print(peer_analyzer.format_report(peer_result))
+    def business_report():
+        business = BusinessAnalyzer(ticker)
+        business.analyze()
+        return business.format_report()
+    
+    def fundamentals_report():
+        fundamentals = FundamentalAnalyzer(ticker)
+        fundamentals.analyze()
+        return fundamentals.format_report()
+    
+    def valuation_report():
+        valuation = StockValuation(ticker)
+        val_summary = valuation.analyze()
+        return valuation.format_report(val_summary)
+    
+    def insider_report():
+        insider_tracker = InsiderTracker()
+        insider_summary = insider_tracker.get_insider_summary(ticker)
+        if insider_summary:
+            return insider_tracker.format_summary(insider_summary)
+        return "   No recent insider transactions found"
+    
+    def short_interest_report():
+        short_tracker = ShortInterestTracker()
+        short_data = short_tracker.get_short_interest(ticker)
+        if short_data:
+            return short_tracker.format_report(short_data)
+        return "   No short interest data available"
+    
+    def earnings_report():
+        earnings_tracker = EarningsTracker(ticker)
+        earnings_summary = earnings_tracker.analyze()
+        return earnings_tracker.format_report(earnings_summary)
+    
+    def shareholder_returns_report():
+        div_tracker = BuybackDividendTracker(ticker)
+        buyback_data = div_tracker.analyze_buybacks()
+        dividend_data = div_tracker.analyze_dividends()
+        return div_tracker.format_report(buyback_data, dividend_data)
+    
+    def options_report():
+        options_analyzer = OptionsAnalyzer(ticker)
+        options_data = options_analyzer.analyze()
+        return options_analyzer.format_report(options_data)
+    
+    def technical_report():
+        tech_analyzer = TechnicalAnalyzer(ticker)
+        tech_data = tech_analyzer.analyze()
+        return tech_analyzer.format_report(tech_data)
+    
+    def peer_report():
+        peer_analyzer = CompetitorAnalyzer(ticker)
+        peer_result = peer_analyzer.analyze()
+        return peer_analyzer.format_report(peer_result)
+    
+    steps = [
+        ("Understanding the Business...", business_report),
+        ("Analyzing Financials...", fundamentals_report),
+        ("Valuation (Fair Value)...", valuation_report),
+        ("Insider Activity (SEC Form 4)...", insider_report),
+        ("Short Interest...", short_interest_report),
+        ("Earnings History...", earnings_report),
+        ("Shareholder Returns...", shareholder_returns_report),
+        ("Options Analysis...", options_report),
+        ("Technical Analysis...", technical_report),
+        ("Peer Comparison...", peer_report),
+    ]
+    
+    # Steps 1-10 are independent network fetches (Yahoo, SEC), so run them
+    # concurrently and print each report in order as soon as it's ready
+    with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as pool:
+        futures = [pool.submit(report) for _, report in steps]
+        
+        for step, ((title, _), future) in enumerate(zip(steps, futures), 1):
+            print(f"\n📍 Step {step}: {title}")
+            # One failing section shouldn't cost the rest of the report
+            try:
+                print(future.result())
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
     
     # 11. Check if in watchlist
     existing = get_research(ticker)
@@ -195,11 +215,7 @@ def add_to_watchlist(ticker: str):
     """Add a stock to watchlist with basic info."""
     ticker = ticker.upper()
     
-    import yfinance as yf
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    
-    name = info.get('shortName', ticker)
+    name = load_info(ticker).get('shortName', ticker)
     
     save_research(ticker=ticker, name=name, status='watching')
     
@@ -249,8 +265,7 @@ def update_thesis(ticker: str):
     # Get name if not exists
     name = None
     if not existing:
-        import yfinance as yf
-        name = yf.Ticker(ticker).info.get('shortName', ticker)
+        name = load_info(ticker).get('shortName', ticker)
     
     save_research(
         ticker=ticker,
@@ -268,8 +283,6 @@ def update_thesis(ticker: str):
 
 def check_price_alerts():
     """Check if any watchlist stocks hit price targets."""
-    import yfinance as yf
-    
     alerts = get_price_alerts()
     
     if not alerts:
@@ -282,30 +295,32 @@ def check_price_alerts():
     
     triggered = []
     
+    # One batched download for every ticker with a target
+    prices = get_last_prices([stock['ticker'] for stock in alerts])
+    
     for stock in alerts:
         ticker = stock['ticker']
-        try:
-            current = yf.Ticker(ticker).info.get('regularMarketPrice', 0)
-            
-            buy_below = stock['buy_below']
-            sell_above = stock['sell_above']
-            
-            status = "—"
-            if buy_below and current <= buy_below:
-                status = f"🟢 BUY ZONE (${current:.2f} ≤ ${buy_below:.2f})"
-                triggered.append((ticker, 'buy', current, buy_below))
-            elif sell_above and current >= sell_above:
-                status = f"🔴 SELL ZONE (${current:.2f} ≥ ${sell_above:.2f})"
-                triggered.append((ticker, 'sell', current, sell_above))
-            else:
-                status = f"👀 ${current:.2f}"
-                if buy_below:
-                    status += f" (buy < ${buy_below:.2f})"
-            
-            print(f"  {ticker}: {status}")
-            
-        except Exception as e:
+        current = prices.get(ticker)
+        if current is None:
             print(f"  {ticker}: Error getting price")
+            continue
+        
+        buy_below = stock['buy_below']
+        sell_above = stock['sell_above']
+        
+        status = "—"
+        if buy_below and current <= buy_below:
+            status = f"🟢 BUY ZONE (${current:.2f} ≤ ${buy_below:.2f})"
+            triggered.append((ticker, 'buy', current, buy_below))
+        elif sell_above and current >= sell_above:
+            status = f"🔴 SELL ZONE (${current:.2f} ≥ ${sell_above:.2f})"
+            triggered.append((ticker, 'sell', current, sell_above))
+        else:
+            status = f"👀 ${current:.2f}"
+            if buy_below:
+                status += f" (buy < ${buy_below:.2f})"
+        
+        print(f"  {ticker}: {status}")
     
     if triggered:
         print("\n" + "─" * 60)
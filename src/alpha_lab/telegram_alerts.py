@@ -21,7 +21,7 @@ Usage:
 """
 
 import os
-import urllib.request
+import http.client
 import urllib.parse
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -72,6 +72,9 @@ class TelegramAlerter:
         # Load from config file if not in env
         if not self.token or not self.chat_id:
             self._load_from_config()
+        
+        # Keep-alive connection to the Bot API, shared by every send()
+        self._conn = None
     
     def _load_from_config(self):
         """Load credentials from config file."""
@@ -112,21 +115,43 @@ class TelegramAlerter:
             print("Telegram not configured. Set TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID")
             return False
         
+        data = {
+            'chat_id': self.chat_id,
+            'text': message,
+            'disable_notification': silent
+        }
+        encoded = urllib.parse.urlencode(data)
+        
         try:
-            url = f'https://api.telegram.org/bot{self.token}/sendMessage'
-            data = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'disable_notification': silent
-            }
-            encoded = urllib.parse.urlencode(data).encode()
-            req = urllib.request.Request(url, data=encoded)
-            urllib.request.urlopen(req, timeout=30)
+            status = self._post(f'/bot{self.token}/sendMessage', encoded)
+            if status != 200:
+                print(f"Failed to send Telegram: HTTP {status}")
+                return False
             return True
         except Exception as e:
             print(f"Failed to send Telegram: {e}")
             return False
     
+    def _post(self, path: str, body: str) -> int:
+        """POST form data over the shared connection, reconnecting once if it went stale."""
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        
+        while True:
+            reused = self._conn is not None
+            if not reused:
+                self._conn = http.client.HTTPSConnection('api.telegram.org', timeout=10)
+            try:
+                self._conn.request('POST', path, body, headers)
+                response = self._conn.getresponse()
+                response.read()
+                return response.status
+            except (http.client.HTTPException, OSError) as e:
+                self._conn.close()
+                self._conn = None
+                # Only a dropped keep-alive is safe to retry; a timeout may already have delivered
+                if not reused or isinstance(e, TimeoutError):
+                    raise
+    
     def send_alert(self, alert: Alert) -> bool:
         """Send formatted alert."""
         # Format based on priority
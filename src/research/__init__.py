@@ -4,5 +4,21 @@ Research Platform
 Deep fundamental research to find edge in small caps.
 """
 
-from .discovery import StockDiscovery, discover_stocks
+# Resolved lazily (PEP 562) so importing a light submodule such as
+# research.database doesn't drag in yfinance/pandas via discovery.
+_LAZY_EXPORTS = {
+    'StockDiscovery': '.discovery',
+    'discover_stocks': '.discovery',
+}
 
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,46 +13,96 @@ Runs daily via cron and sends Telegram alerts.
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import yfinance as yf
+import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import load_info
 from src.research.database import get_watchlist, get_price_alerts, get_research
 from src.alpha_lab.telegram_alerts import send_message
 
 
-def check_price_targets() -> List[Tuple[str, str, float, float]]:
-    """Check if any watchlist stocks hit price targets."""
+def _recent_closes(tickers: List[str]) -> pd.DataFrame:
+    """Last few daily closes for all tickers from a single batched Yahoo download."""
+    data = yf.download(tickers, period='5d', auto_adjust=False,
+                       progress=False, threads=True)
+    closes = data['Close']
+    if isinstance(closes, pd.Series):  # single ticker, flat columns
+        closes = closes.to_frame(tickers[0])
+    return closes.ffill()
+
+
+def get_last_prices(tickers: List[str]) -> Dict[str, float]:
+    """Latest price for each ticker from a single batched Yahoo download."""
+    if not tickers:
+        return {}
+    
+    try:
+        last = _recent_closes(tickers).iloc[-1]
+    except Exception:
+        return {}
+    
+    return {ticker: float(price) for ticker, price in last.items() if pd.notna(price)}
+
+
+def get_daily_changes(tickers: List[str]) -> Dict[str, Tuple[float, float]]:
+    """(latest price, % change vs previous close) per ticker from one batched download."""
+    if not tickers:
+        return {}
+    
+    try:
+        closes = _recent_closes(tickers)
+        if len(closes) < 2:
+            return {}
+        last = closes.iloc[-1]
+        prev = closes.iloc[-2]
+    except Exception:
+        return {}
+    
+    return {
+        ticker: (float(price), float((price / prev[ticker] - 1) * 100))
+        for ticker, price in last.items()
+        if pd.notna(price) and pd.notna(prev[ticker]) and prev[ticker]
+    }
+
+
+def check_price_targets(prices: Optional[Dict[str, float]] = None) -> List[Tuple[str, str, float, float]]:
+    """
+    Check if any watchlist stocks hit price targets.
+    
+    Args:
+        prices: Latest prices already fetched for the watchlist (downloaded if None)
+    """
     alerts = get_price_alerts()
     triggered = []
     
+    if prices is None:
+        prices = get_last_prices([stock['ticker'] for stock in alerts])
+    
     for stock in alerts:
         ticker = stock['ticker']
-        try:
-            info = yf.Ticker(ticker).info
-            current = info.get('regularMarketPrice') or info.get('currentPrice', 0)
-            
-            if not current:
-                continue
-            
-            buy_below = stock['buy_below']
-            sell_above = stock['sell_above']
-            
-            if buy_below and current <= buy_below:
-                triggered.append((ticker, 'buy', current, buy_below))
-            elif sell_above and current >= sell_above:
-                triggered.append((ticker, 'sell', current, sell_above))
-                
-        except:
+        current = prices.get(ticker)
+        
+        if not current:
             continue
+        
+        buy_below = stock['buy_below']
+        sell_above = stock['sell_above']
+        
+        if buy_below and current <= buy_below:
+            triggered.append((ticker, 'buy', current, buy_below))
+        elif sell_above and current >= sell_above:
+            triggered.append((ticker, 'sell', current, sell_above))
     
     return triggered
 
 
-def check_upcoming_earnings() -> List[Dict]:
+def check_upcoming_earnings(watchlist: Optional[List[Dict]] = None) -> List[Dict]:
     """Check for upcoming earnings in watchlist."""
-    watchlist = get_watchlist()
+    if watchlist is None:
+        watchlist = get_watchlist()
     upcoming = []
     
     today = datetime.now().date()
@@ -61,7 +111,8 @@ def check_upcoming_earnings() -> List[Dict]:
     for stock in watchlist:
         ticker = stock['ticker']
         try:
-            info = yf.Ticker(ticker).info
+            # Shared, disk-cached profile (deep research/discovery may have it)
+            info = load_info(ticker)
             
             # Get earnings date
             earnings_ts = info.get('earningsTimestamp')
@@ -83,29 +134,35 @@ def check_upcoming_earnings() -> List[Dict]:
     return upcoming
 
 
-def check_significant_moves() -> List[Dict]:
+def check_significant_moves(
+    watchlist: Optional[List[Dict]] = None,
+    changes: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[Dict]:
     """Check for significant price moves in watchlist."""
-    watchlist = get_watchlist()
+    if watchlist is None:
+        watchlist = get_watchlist()
     moves = []
     
+    # One batched price download for the whole watchlist instead of an
+    # .info round-trip per stock
+    if changes is None:
+        changes = get_daily_changes([stock['ticker'] for stock in watchlist])
+    
     for stock in watchlist:
         ticker = stock['ticker']
-        try:
-            info = yf.Ticker(ticker).info
-            
-            change_pct = info.get('regularMarketChangePercent', 0)
-            current = info.get('regularMarketPrice', 0)
-            
-            if abs(change_pct) >= 5:  # 5%+ move
-                moves.append({
-                    'ticker': ticker,
-                    'name': stock['name'],
-                    'change_pct': change_pct,
-                    'price': current,
-                    'thesis': stock.get('thesis', ''),
-                })
-        except:
+        if ticker not in changes:
             continue
+        
+        current, change_pct = changes[ticker]
+        
+        if abs(change_pct) >= 5:  # 5%+ move
+            moves.append({
+                'ticker': ticker,
+                'name': stock['name'],
+                'change_pct': change_pct,
+                'price': current,
+                'thesis': stock.get('thesis', ''),
+            })
     
     # Sort by absolute change
     moves.sort(key=lambda x: abs(x['change_pct']), reverse=True)
@@ -174,10 +231,16 @@ def run_research_alerts(send_telegram: bool = True):
     """Run all research alert checks."""
     print("\n📬 Running Research Alerts...")
     
+    # Load the watchlist and its prices once; every check works off them
+    # (price-target stocks are a subset of the watchlist)
+    watchlist = get_watchlist()
+    changes = get_daily_changes([stock['ticker'] for stock in watchlist])
+    prices = {ticker: price for ticker, (price, _) in changes.items()}
+    
     # Check all conditions
-    price_alerts = check_price_targets()
-    earnings = check_upcoming_earnings()
-    moves = check_significant_moves()
+    price_alerts = check_price_targets(prices)
+    earnings = check_upcoming_earnings(watchlist)
+    moves = check_significant_moves(watchlist, changes)
     
     print(f"   Price targets: {len(price_alerts)} triggered")
     print(f"   Upcoming earnings: {len(earnings)}")
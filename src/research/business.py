@@ -13,12 +13,26 @@ Uses SEC filings + AI to extract business insights.
 
 import os
 import requests
-import yfinance as yf
+import xml.etree.ElementTree as ET
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from typing import Dict, Optional, List
 from dataclasses import dataclass
+from urllib.parse import quote
 import json
 import re
+import sys
+
+# Optional: GPT news sentiment (falls back to keyword matching without it)
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.research.cache import get_ticker
 
 
 @dataclass
@@ -81,9 +95,20 @@ class BusinessAnalyzer:
         'Accept-Encoding': 'gzip, deflate',
     }
     
+    # Industry competitor mapping
+    INDUSTRY_COMPETITORS = {
+        'Software—Infrastructure': ['MSFT', 'AMZN', 'GOOGL', 'CRM', 'ORCL'],
+        'Software—Application': ['CRM', 'ADBE', 'NOW', 'WDAY', 'INTU'],
+        'Internet Content & Information': ['GOOGL', 'META', 'SNAP', 'PINS', 'TWTR'],
+        'Semiconductors': ['NVDA', 'AMD', 'INTC', 'QCOM', 'AVGO'],
+        'Internet Retail': ['AMZN', 'BABA', 'JD', 'MELI', 'SE'],
+        'Biotechnology': ['AMGN', 'GILD', 'BIIB', 'VRTX', 'REGN'],
+        'Specialty Retail': ['HD', 'LOW', 'TJX', 'ROST', 'BBY'],
+    }
+    
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
         self.profile: Optional[BusinessProfile] = None
     
@@ -199,18 +224,7 @@ class BusinessAnalyzer:
         industry = self.info.get('industry', '')
         sector = self.info.get('sector', '')
         
-        # Industry competitor mapping
-        competitor_map = {
-            'Software—Infrastructure': ['MSFT', 'AMZN', 'GOOGL', 'CRM', 'ORCL'],
-            'Software—Application': ['CRM', 'ADBE', 'NOW', 'WDAY', 'INTU'],
-            'Internet Content & Information': ['GOOGL', 'META', 'SNAP', 'PINS', 'TWTR'],
-            'Semiconductors': ['NVDA', 'AMD', 'INTC', 'QCOM', 'AVGO'],
-            'Internet Retail': ['AMZN', 'BABA', 'JD', 'MELI', 'SE'],
-            'Biotechnology': ['AMGN', 'GILD', 'BIIB', 'VRTX', 'REGN'],
-            'Specialty Retail': ['HD', 'LOW', 'TJX', 'ROST', 'BBY'],
-        }
-        
-        competitors = competitor_map.get(industry, [])
+        competitors = self.INDUSTRY_COMPETITORS.get(industry, [])
         
         # Remove self from competitors
         competitors = [c for c in competitors if c != self.ticker]
@@ -345,9 +359,6 @@ class BusinessAnalyzer:
     def _get_google_news(self) -> List[Dict]:
         """Fetch news from Google News RSS (free, no API key)."""
         try:
-            import xml.etree.ElementTree as ET
-            from urllib.parse import quote
-            
             # Get company name for search
             company_name = self.info.get('shortName', self.ticker)
             
@@ -375,7 +386,6 @@ class BusinessAnalyzer:
                 # Parse date (format: "Mon, 25 Nov 2024 12:00:00 GMT")
                 if pub_date_elem is not None and pub_date_elem.text:
                     try:
-                        from email.utils import parsedate_to_datetime
                         dt = parsedate_to_datetime(pub_date_elem.text)
                         date_str = dt.strftime('%Y-%m-%d')
                     except:
@@ -408,9 +418,10 @@ class BusinessAnalyzer:
         if not news:
             return None
         
+        if not OPENAI_AVAILABLE:
+            return self._simple_sentiment_analysis(news)
+        
         try:
-            from openai import OpenAI
-            
             # Get API key
             api_key = os.environ.get('OPENAI_API_KEY')
             if not api_key:
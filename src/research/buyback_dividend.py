@@ -14,10 +14,11 @@ import sys
 from datetime import datetime, timedelta
 from typing import Optional, List
 from dataclasses import dataclass
-import yfinance as yf
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker
+
 
 @dataclass
 class BuybackData:
@@ -78,7 +79,7 @@ class BuybackDividendTracker:
     
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
     
     def analyze_buybacks(self) -> BuybackData:
@@ -0,0 +1,111 @@
+"""
+Disk Cache
+
+Keep slow network pulls (Yahoo price history, SEC filings) on disk
+between runs, the same way the ticker universe is cached as a CSV.
+
+Entries are pickled under data/cache/<namespace>/<key>.pkl and expire
+by file age.
+
+get_ticker() hands out one shared yf.Ticker per symbol for the process,
+so analyzers run back-to-back on the same stock reuse its downloads.
+load_info() adds the disk cache on top for a symbol's .info profile, so
+scanners and reports run within a day share one Yahoo pull per stock.
+"""
+
+import os
+import pickle
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+import yfinance as yf
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '../../data/cache')
+
+# Company profiles (.info) move daily at most
+INFO_CACHE_TTL = 24 * 3600
+
+
+def _cache_path(namespace: str, key: str) -> str:
+    """File path for a cache entry (key sanitized for the filesystem)."""
+    safe_key = "".join(c if c.isalnum() or c in '-_.' else '_' for c in key)
+    return os.path.join(CACHE_DIR, namespace, f"{safe_key}.pkl")
+
+
+def load_cached(namespace: str, key: str, max_age: Optional[float] = None) -> Any:
+    """
+    Get a cached value.
+
+    Args:
+        namespace: Cache sub-directory (e.g. 'history')
+        key: Entry key within the namespace
+        max_age: Max age in seconds (None = never expires)
+
+    Returns:
+        The cached value, or None if missing, expired or unreadable
+    """
+    path = _cache_path(namespace, key)
+    if not os.path.exists(path):
+        return None
+
+    if max_age is not None:
+        age = datetime.now().timestamp() - os.path.getmtime(path)
+        if age > max_age:
+            return None
+
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_cached(namespace: str, key: str, value: Any) -> None:
+    """Store a value in the cache (best effort - failures are ignored)."""
+    path = _cache_path(namespace, key)
+
+    # Write to a private temp file then rename, so concurrent readers
+    # never see a half-written pickle
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=128)
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Shared yf.Ticker for a symbol.
+
+    yfinance keeps .info and the statements on the Ticker object once
+    fetched, so every caller holding the same instance pays for them once.
+    Long-running scripts can call get_ticker.cache_clear() to refresh.
+    """
+    return yf.Ticker(symbol)
+
+
+def load_info(symbol: str, max_age: Optional[float] = INFO_CACHE_TTL,
+              rate_limiter=None) -> dict:
+    """
+    A symbol's .info profile, served from the disk cache when fresh.
+
+    rate_limiter (anything with .acquire()) throttles only the Yahoo
+    fetches on a cache miss, so cached rescans run at full speed.
+    """
+    info = load_cached('info', symbol, max_age=max_age)
+    if info is None:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        info = get_ticker(symbol).info
+        if info:
+            save_cached('info', symbol, info)
+    return info
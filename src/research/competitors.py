@@ -17,13 +17,23 @@ Auto-discovers peers based on:
 
 import os
 import sys
+import time
 from typing import Optional, List, Dict, Set
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
+import pandas as pd
 import re
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker
+
+# YTD returns by symbol, shared by every comparison in the process
+# (sector peers overlap heavily when a watchlist is analyzed back to back)
+YTD_CACHE_TTL = 300
+_ytd_cache: Dict[str, tuple] = {}  # symbol -> (monotonic time, YTD %)
+
 
 @dataclass
 class CompanyMetrics:
@@ -105,10 +115,27 @@ class CompetitorAnalyzer:
         'Real Estate': ['AMT', 'PLD', 'EQIX', 'PSA'],
     }
     
+    # Concurrent Yahoo lookups when scoring/loading peers
+    PEER_WORKERS = 8
+    
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
+        self._ytd_returns = {}
+    
+    def _prefetch_info(self, symbols: List[str]):
+        """Load .info for many symbols concurrently (each Ticker keeps its copy)."""
+        tickers = [get_ticker(symbol) for symbol in symbols]
+        
+        def load(stock: yf.Ticker):
+            try:
+                return stock.info
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=self.PEER_WORKERS) as pool:
+            list(pool.map(load, tickers))
     
     # Business model specificity (higher = more specific/important)
     MODEL_PRIORITY = {
@@ -163,7 +190,7 @@ class CompetitorAnalyzer:
                          target_mcap: float, target_sector: str, target_desc: str) -> float:
         """Score how well a peer matches (0-100)."""
         try:
-            peer_stock = yf.Ticker(peer_ticker)
+            peer_stock = get_ticker(peer_ticker)
             peer_info = peer_stock.info
             
             # Skip if no market cap
@@ -266,6 +293,9 @@ class CompetitorAnalyzer:
             if not candidates:
                 return []
             
+            # Fetch every candidate's profile up front instead of one by one
+            self._prefetch_info([c for c in candidates if c != self.ticker])
+            
             # Score all candidates
             scored_peers = []
             business_model_matches = []
@@ -295,7 +325,7 @@ class CompetitorAnalyzer:
                     primary_matches = []
                     for score, ticker in business_model_matches:
                         try:
-                            peer_stock = yf.Ticker(ticker)
+                            peer_stock = get_ticker(ticker)
                             peer_desc = peer_stock.info.get('longBusinessSummary', '')
                             peer_models = self._extract_business_model(peer_desc)
                             peer_primary = self._get_primary_model(peer_models)
@@ -335,15 +365,17 @@ class CompetitorAnalyzer:
         # Dynamically discover peers
         peers_list = self._find_peers_dynamically()
         
+        peer_tickers = peers_list[:4]  # Max 4 peers
+        
+        # YTD price history for target + peers in one batched download
+        self._ytd_returns = self._load_ytd_returns([self.ticker, *peer_tickers])
+        
         # Get target metrics
         target = self._get_metrics(self.ticker)
         
-        # Get peer metrics
-        peers = []
-        for peer_ticker in peers_list[:4]:  # Max 4 peers
-            peer_metrics = self._get_metrics(peer_ticker)
-            if peer_metrics:
-                peers.append(peer_metrics)
+        # Get peer metrics (peer .info loads concurrently)
+        with ThreadPoolExecutor(max_workers=self.PEER_WORKERS) as pool:
+            peers = [m for m in pool.map(self._get_metrics, peer_tickers) if m]
         
         # Calculate peer averages
         peer_avg = self._calculate_averages(peers)
@@ -366,21 +398,15 @@ class CompetitorAnalyzer:
     def _get_metrics(self, ticker: str) -> Optional[CompanyMetrics]:
         """Get key metrics for a ticker."""
         try:
-            stock = yf.Ticker(ticker)
+            stock = get_ticker(ticker)
             info = stock.info
             
             market_cap = info.get('marketCap', 0)
             if not market_cap:
                 return None
             
-            # Get YTD return
-            ytd_pct = None
-            try:
-                hist = stock.history(period='ytd')
-                if not hist.empty and len(hist) > 1:
-                    ytd_pct = ((hist['Close'].iloc[-1] / hist['Close'].iloc[0]) - 1) * 100
-            except:
-                pass
+            # YTD return (from the batched download in analyze())
+            ytd_pct = self._ytd_returns.get(ticker)
             
             return CompanyMetrics(
                 ticker=ticker,
@@ -401,6 +427,44 @@ class CompetitorAnalyzer:
         except Exception as e:
             return None
     
+    def _load_ytd_returns(self, symbols: List[str]) -> Dict[str, float]:
+        """YTD % return for each symbol (recent results reused, the rest batched)."""
+        now = time.monotonic()
+        returns = {}
+        missing = []
+        for symbol in symbols:
+            hit = _ytd_cache.get(symbol)
+            if hit and now - hit[0] < YTD_CACHE_TTL:
+                returns[symbol] = hit[1]
+            else:
+                missing.append(symbol)
+        
+        if missing:
+            fetched = self._download_ytd_returns(missing)
+            for symbol, pct in fetched.items():
+                _ytd_cache[symbol] = (now, pct)
+            returns.update(fetched)
+        
+        return returns
+    
+    def _download_ytd_returns(self, symbols: List[str]) -> Dict[str, float]:
+        """YTD % return for each symbol from a single batched Yahoo download."""
+        try:
+            data = yf.download(symbols, period='ytd', auto_adjust=True,
+                               progress=False, threads=True)
+            closes = data['Close']
+        except Exception:
+            return {}
+        if isinstance(closes, pd.Series):  # single ticker, flat columns
+            closes = closes.to_frame(symbols[0])
+        
+        # Symbols need at least two closes this year for a return
+        closes = closes.loc[:, closes.count() > 1]
+        if closes.empty:
+            return {}
+        returns = (closes.ffill().iloc[-1] / closes.bfill().iloc[0] - 1) * 100
+        return {symbol: float(pct) for symbol, pct in returns.items()}
+    
     def _pct(self, value) -> Optional[float]:
         """Convert ratio to percentage if needed."""
         if value is None:
@@ -13,20 +13,57 @@ Your research is your edge. Track it.
 
 import sqlite3
 import os
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional
 import json
+from collections import defaultdict
 
 
 DB_PATH = os.path.join(os.path.dirname(__file__), '../../data/research.db')
 
+# Watchlist display: status sections in order, and their markers
+STATUS_ORDER = ('buying', 'holding', 'watching', 'sold')
+STATUS_EMOJI = {
+    'buying': '🟢',
+    'holding': '📦',
+    'watching': '👀',
+    'sold': '✅',
+}
+CONVICTION_STARS = {'high': '⭐⭐⭐', 'medium': '⭐⭐', 'low': '⭐'}
+
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
 
 def get_connection():
-    """Get database connection."""
+    """
+    Get the shared database connection.
+    
+    Opened once per process: the schema setup and WAL journaling run on
+    first use, and every later call reuses the same connection.
+    """
+    global _conn
+    if _conn is None:
+        with _conn_lock:
+            # Re-check: another thread may have opened it while we waited
+            if _conn is None:
+                _conn = _open_connection()
+    return _conn
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open the database and make sure the schema exists."""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     
+    # WAL lets readers and the writer proceed without blocking each other;
+    # NORMAL sync is durable across app crashes and skips most fsyncs
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    
     # Create tables
     conn.execute('''
         CREATE TABLE IF NOT EXISTS research (
@@ -146,7 +183,6 @@ def save_research(
         research_id = cursor.lastrowid
     
     conn.commit()
-    conn.close()
     return research_id
 
 
@@ -161,7 +197,6 @@ def add_note(ticker: str, note: str, note_type: str = 'general') -> int:
     
     note_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return note_id
 
 
@@ -181,13 +216,11 @@ def get_research(ticker: str) -> Optional[Dict]:
         notes = conn.execute(
             'SELECT * FROM research_notes WHERE ticker = ? ORDER BY created_at DESC',
             (ticker.upper(),)
-        ).fetchall()
+        )
         result['notes'] = [dict(n) for n in notes]
         
-        conn.close()
         return result
     
-    conn.close()
     return None
 
 
@@ -206,9 +239,8 @@ def get_watchlist() -> List[Dict]:
             END,
             conviction DESC,
             last_updated DESC
-    ''').fetchall()
+    ''')
     
-    conn.close()
     return [dict(row) for row in rows]
 
 
@@ -221,9 +253,8 @@ def get_price_alerts() -> List[Dict]:
         FROM research
         WHERE alert_on_price = 1
         AND (buy_below IS NOT NULL OR sell_above IS NOT NULL)
-    ''').fetchall()
+    ''')
     
-    conn.close()
     return [dict(row) for row in rows]
 
 
@@ -241,7 +272,6 @@ def update_position(ticker: str, shares: int, avg_cost: float):
     ''', (shares, avg_cost, shares, datetime.now().isoformat(), ticker.upper()))
     
     conn.commit()
-    conn.close()
 
 
 def format_watchlist() -> str:
@@ -259,31 +289,20 @@ def format_watchlist() -> str:
     ]
     
     # Group by status
-    by_status = {}
+    by_status = defaultdict(list)
     for stock in watchlist:
-        status = stock['status']
-        if status not in by_status:
-            by_status[status] = []
-        by_status[status].append(stock)
-    
-    status_order = ['buying', 'holding', 'watching', 'sold']
-    status_emoji = {
-        'buying': '🟢',
-        'holding': '📦',
-        'watching': '👀',
-        'sold': '✅',
-    }
+        by_status[stock['status']].append(stock)
     
-    for status in status_order:
+    for status in STATUS_ORDER:
         if status not in by_status:
             continue
         
         stocks = by_status[status]
-        lines.append(f"{status_emoji.get(status, '•')} {status.upper()} ({len(stocks)})")
+        lines.append(f"{STATUS_EMOJI.get(status, '•')} {status.upper()} ({len(stocks)})")
         lines.append("─" * 40)
         
         for s in stocks:
-            conviction_stars = {'high': '⭐⭐⭐', 'medium': '⭐⭐', 'low': '⭐'}.get(s['conviction'], '')
+            conviction_stars = CONVICTION_STARS.get(s['conviction'], '')
             
             lines.append(f"  {s['ticker']} - {s['name'][:25] if s['name'] else 'Unknown'}")
             lines.append(f"    Conviction: {conviction_stars}")
@@ -18,20 +18,31 @@ This is where the edge is - finding quality companies
 that institutions can't buy and retail hasn't found yet.
 """
 
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 from dataclasses import dataclass
-import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import os
 import io
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.research.cache import load_info
+from src.research.rate_limit import TokenBucket
 
 
 @dataclass
 class DiscoveredStock:
     """A potentially interesting undiscovered stock."""
+    # One per scanned ticker - slots keep a full-universe scan compact
+    __slots__ = ('ticker', 'name', 'sector', 'industry', 'market_cap', 'price',
+                 'revenue_growth', 'gross_margin', 'analyst_count', 'pe_ratio',
+                 'ps_ratio', 'insider_ownership', 'short_percent',
+                 'discovery_reason', 'score')
+    
     ticker: str
     name: str
     sector: str
@@ -59,12 +70,19 @@ class StockDiscovery:
     The edge: Finding quality before the crowd.
     """
     
+    # Symbols with these characters are units/warrants/preferreds, not common stock
+    SYMBOL_JUNK_CHARS = frozenset('^/$.')
+    
     # Cache file for ticker universe
     UNIVERSE_CACHE = os.path.join(os.path.dirname(__file__), '../../data/ticker_universe.csv')
     
+    # Concurrent Yahoo lookups while scanning
+    SCAN_WORKERS = 4
+    
     def __init__(self):
         self.discovered: List[DiscoveredStock] = []
         self.universe: List[str] = []
+        self._rate_limiter: Optional[TokenBucket] = None
     
     def get_full_universe(self) -> List[str]:
         """
@@ -123,12 +141,12 @@ class StockDiscovery:
         # Source 3: NASDAQ screener API (backup, has more data)
         if len(tickers) < 3000:
             try:
-                for exchange in ['NASDAQ', 'NYSE', 'AMEX']:
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                    'Accept': 'application/json',
+                }
+                for exchange in ('NASDAQ', 'NYSE', 'AMEX'):
                     url = f"https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=10000&exchange={exchange}"
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'Accept': 'application/json',
-                    }
                     resp = requests.get(url, headers=headers, timeout=30)
                     if resp.status_code == 200:
                         data = resp.json()
@@ -137,7 +155,7 @@ class StockDiscovery:
                             symbol = row.get('symbol', '').strip()
                             if symbol and len(symbol) <= 5:
                                 # Filter out weird symbols
-                                if not any(c in symbol for c in ['^', '/', '$', '.']):
+                                if self.SYMBOL_JUNK_CHARS.isdisjoint(symbol):
                                     tickers.add(symbol)
                 print(f"      API backup: total {len(tickers)} tickers")
             except Exception as e:
@@ -201,12 +219,11 @@ class StockDiscovery:
         scanned = 0
         errors = 0
         
-        for i, ticker in enumerate(scan_list):
+        for i, (ticker, stock) in enumerate(self._analyze_many(scan_list, rate=20)):
             if i % 50 == 0 and i > 0:
                 print(f"   Progress: {i}/{len(scan_list)} scanned, {len(discovered)} found...")
             
             try:
-                stock = self._analyze_stock(ticker)
                 scanned += 1
                 
                 if stock is None:
@@ -228,9 +245,6 @@ class StockDiscovery:
             except Exception as e:
                 errors += 1
                 continue
-            
-            # Rate limiting for yfinance
-            time.sleep(0.2)
         
         # Sort by score
         discovered.sort(key=lambda x: x.score, reverse=True)
@@ -243,6 +257,19 @@ class StockDiscovery:
         
         return discovered
     
+    def _analyze_many(self, tickers: List[str], rate: float) -> Iterator[Tuple[str, Optional[DiscoveredStock]]]:
+        """
+        Analyze tickers concurrently, yielding (ticker, result) in input order.
+        
+        Each lookup is a network round-trip to Yahoo, so a few workers
+        overlap the waiting. Workers don't sleep between calls; the only
+        throttle is one token bucket shared by the workers, which caps
+        Yahoo fetches at `rate` per second (cached profiles aren't throttled).
+        """
+        self._rate_limiter = TokenBucket(rate)
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            yield from zip(tickers, pool.map(self._analyze_stock, tickers))
+    
     def _analyze_stock(self, ticker: str) -> Optional[DiscoveredStock]:
         """
         Analyze a single stock for discovery potential.
@@ -256,8 +283,9 @@ class StockDiscovery:
         6. Free cash flow - Actually generating or destroying cash?
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # Profiles are disk-cached for a day, so rescans (quick discovery,
+            # smart discovery, weekly scan) don't re-pull the same tickers
+            info = load_info(ticker, rate_limiter=self._rate_limiter)
             
             # Basic info
             name = info.get('shortName', ticker)
@@ -632,9 +660,8 @@ class StockDiscovery:
             batch = universe[i:i+batch_size]
             print(f"   Scanning batch {i//batch_size + 1}/{len(universe)//batch_size + 1}...")
             
-            for ticker in batch:
+            for ticker, stock in self._analyze_many(batch, rate=25):
                 try:
-                    stock = self._analyze_stock(ticker)
                     scanned += 1
                     
                     if stock is None:
@@ -653,8 +680,6 @@ class StockDiscovery:
                 except Exception:
                     errors += 1
                     continue
-                
-                time.sleep(0.15)  # Rate limiting
             
             # Progress update
             print(f"      Scanned: {scanned}, Found: {len(discovered)}, Errors: {errors}")
@@ -151,6 +151,7 @@ class DiscoveryDatabase:
         c.execute('CREATE INDEX IF NOT EXISTS idx_scan_results_score ON scan_results(score DESC)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_score_history_ticker ON score_history(ticker)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_improvements_date ON improvements(detected_date)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_improvements_ticker ON improvements(ticker, curr_week)')
         
         conn.commit()
         conn.close()
@@ -197,44 +198,27 @@ class DiscoveryDatabase:
             ''', (now.isoformat(), week_number, year, total_scanned, len(results), json.dumps(criteria)))
             scan_id = c.lastrowid
         
-        # Save individual results
-        for stock in results:
-            c.execute('''
-                INSERT OR REPLACE INTO scan_results (
-                    scan_id, ticker, name, sector, industry, market_cap_b, price,
-                    revenue_b, revenue_growth, gross_margin, operating_margin, fcf_margin,
-                    net_cash_b, debt_to_equity, analyst_count, insider_ownership,
-                    pe_ratio, ps_ratio, score, discovery_reason
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                scan_id,
-                stock.get('ticker'),
-                stock.get('name'),
-                stock.get('sector'),
-                stock.get('industry'),
-                stock.get('market_cap_b'),
-                stock.get('price'),
-                stock.get('revenue_b'),
-                stock.get('revenue_growth'),
-                stock.get('gross_margin'),
-                stock.get('operating_margin'),
-                stock.get('fcf_margin'),
-                stock.get('net_cash_b'),
-                stock.get('debt_to_equity'),
-                stock.get('analyst_count'),
-                stock.get('insider_ownership'),
-                stock.get('pe_ratio'),
-                stock.get('ps_ratio'),
-                stock.get('score'),
-                stock.get('discovery_reason'),
-            ))
-            
-            # Also save to score history
-            fcf_positive = 1 if stock.get('fcf_margin', 0) > 0 else 0
-            c.execute('''
-                INSERT OR REPLACE INTO score_history (ticker, week_number, year, score, revenue_growth, fcf_positive)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (stock.get('ticker'), week_number, year, stock.get('score'), stock.get('revenue_growth'), fcf_positive))
+        # Save individual results (one executemany per table instead of a statement per stock)
+        columns = (
+            'ticker', 'name', 'sector', 'industry', 'market_cap_b', 'price',
+            'revenue_b', 'revenue_growth', 'gross_margin', 'operating_margin', 'fcf_margin',
+            'net_cash_b', 'debt_to_equity', 'analyst_count', 'insider_ownership',
+            'pe_ratio', 'ps_ratio', 'score', 'discovery_reason',
+        )
+        c.executemany(f'''
+            INSERT OR REPLACE INTO scan_results (scan_id, {', '.join(columns)})
+            VALUES ({', '.join('?' * (len(columns) + 1))})
+        ''', [(scan_id, *(stock.get(col) for col in columns)) for stock in results])
+        
+        # Also save to score history
+        c.executemany('''
+            INSERT OR REPLACE INTO score_history (ticker, week_number, year, score, revenue_growth, fcf_positive)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [
+            (stock.get('ticker'), week_number, year, stock.get('score'), stock.get('revenue_growth'),
+             1 if stock.get('fcf_margin', 0) > 0 else 0)
+            for stock in results
+        ])
         
         conn.commit()
         conn.close()
@@ -281,7 +265,7 @@ class DiscoveryDatabase:
         ''', (prev_week, prev_year, curr_week, curr_year, min_score_change))
         
         improvements = []
-        for row in c.fetchall():
+        for row in c:
             ticker, name, sector, prev_score, curr_score, prev_rev, curr_rev, prev_fcf, curr_fcf = row
             
             # Determine reason for improvement
@@ -307,20 +291,34 @@ class DiscoveryDatabase:
                 improvement_reason=' + '.join(reasons) if reasons else 'Score improved'
             )
             improvements.append(improvement)
-            
-            # Record improvement
-            c.execute('''
-                INSERT INTO improvements (
-                    ticker, detected_date, prev_week, curr_week, 
-                    prev_score, curr_score, score_change, 
-                    improvement_reason, fcf_turned_positive
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                ticker, now.isoformat(), prev_week, curr_week,
-                prev_score, curr_score, curr_score - prev_score,
-                improvement.improvement_reason,
-                1 if improvement.fcf_turned_positive else 0
-            ))
+        
+        # Record improvements, skipping ones already recorded this week (the
+        # scan, alerts and --improvements all call this); the existence check
+        # runs inside SQLite as an index probe per row. Weeks are keyed by
+        # (week, year) as in score_history, the year taken from detected_date
+        week_start = (now - timedelta(days=7)).isoformat()
+        c.executemany('''
+            INSERT INTO improvements (
+                ticker, detected_date, prev_week, curr_week, 
+                prev_score, curr_score, score_change, 
+                improvement_reason, fcf_turned_positive
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE NOT EXISTS (
+                SELECT 1 FROM improvements
+                WHERE ticker = ? AND curr_week = ?
+                AND strftime('%Y', detected_date) = ? AND detected_date >= ?
+            )
+        ''', [
+            (
+                imp.ticker, now.isoformat(), prev_week, curr_week,
+                imp.prev_score, imp.curr_score, imp.score_change,
+                imp.improvement_reason,
+                1 if imp.fcf_turned_positive else 0,
+                imp.ticker, curr_week, str(curr_year), week_start,
+            )
+            for imp in improvements
+        ])
         
         conn.commit()
         conn.close()
@@ -342,10 +340,11 @@ class DiscoveryDatabase:
             LIMIT ?
         ''', (ticker, weeks))
         
-        results = [(row[0], row[1]) for row in c.fetchall()]
+        results = c.fetchall()  # (week, score) tuples
         conn.close()
         
-        return list(reversed(results))  # Oldest first
+        results.reverse()  # Oldest first
+        return results
     
     def get_top_improvers_all_time(self, limit: int = 20) -> List[Dict]:
         """Get stocks with biggest improvements historically."""
@@ -366,7 +365,7 @@ class DiscoveryDatabase:
             LIMIT ?
         ''', (limit,))
         
-        results = [dict(row) for row in c.fetchall()]
+        results = [dict(row) for row in c]
         conn.close()
         
         return results
@@ -394,7 +393,7 @@ class DiscoveryDatabase:
             LIMIT ?
         ''', (scan_id, min_score, limit))
         
-        results = [dict(row) for row in c.fetchall()]
+        results = [dict(row) for row in c]
         conn.close()
         
         return results
@@ -431,7 +430,7 @@ class DiscoveryDatabase:
             ORDER BY curr.score DESC
         ''', (prev_week, prev_year, curr_week, curr_year))
         
-        results = [dict(row) for row in c.fetchall()]
+        results = [dict(row) for row in c]
         conn.close()
         
         return results
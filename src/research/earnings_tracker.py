@@ -11,13 +11,15 @@ Why this matters:
 
 import os
 import sys
-from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 from dataclasses import dataclass
-import yfinance as yf
+import numpy as np
+import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker
+
 
 @dataclass
 class EarningsResult:
@@ -64,7 +66,7 @@ class EarningsTracker:
     
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
     
     def analyze(self) -> EarningsSummary:
@@ -86,8 +88,8 @@ class EarningsTracker:
         beat_rate = (beats / total * 100) if total > 0 else 0
         
         # Average surprise
-        surprises = [h.surprise_pct for h in history if h.surprise_pct is not None]
-        avg_surprise = sum(surprises) / len(surprises) if surprises else 0
+        surprises = np.array([h.surprise_pct for h in history if h.surprise_pct is not None], dtype=float)
+        avg_surprise = float(np.nanmean(surprises)) if np.isfinite(surprises).any() else 0
         
         # Calculate streak
         streak, streak_type = self._calculate_streak(history)
@@ -115,123 +117,117 @@ class EarningsTracker:
         """Get historical earnings results."""
         history = []
         
+        # Get earnings history from yfinance
         try:
-            # Get earnings history from yfinance
             earnings = self.stock.earnings_history
-            
-            if earnings is None or earnings.empty:
-                # Try quarterly earnings
+        except Exception:
+            earnings = None
+        
+        if earnings is None or earnings.empty:
+            # Try quarterly earnings
+            try:
                 quarterly = self.stock.quarterly_earnings
-                if quarterly is not None and not quarterly.empty:
-                    for idx, row in quarterly.iterrows():
-                        date_str = idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx)
-                        quarter = self._get_quarter(idx) if hasattr(idx, 'month') else ""
-                        
-                        history.append(EarningsResult(
-                            date=date_str,
-                            quarter=quarter,
-                            eps_estimate=None,
-                            eps_actual=row.get('Earnings', None),
-                            surprise=None,
-                            surprise_pct=None,
-                            beat=None,
-                        ))
-                return history
+            except Exception:
+                quarterly = None
+            if quarterly is not None and not quarterly.empty:
+                for row in quarterly.itertuples():
+                    idx = row.Index
+                    date_str = idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx)
+                    quarter = self._get_quarter(idx)
+                    
+                    history.append(EarningsResult(
+                        date=date_str,
+                        quarter=quarter,
+                        eps_estimate=None,
+                        eps_actual=getattr(row, 'Earnings', None),
+                        surprise=None,
+                        surprise_pct=None,
+                        beat=None,
+                    ))
+            return history
+        
+        # Drop quarters with nothing reported and keep only the newest 12 before looping
+        eps_cols = [col for col in ('epsEstimate', 'epsActual') if col in earnings.columns]
+        if eps_cols:
+            earnings = earnings.dropna(how='all', subset=eps_cols)
+        earnings = earnings.sort_index(ascending=False).head(12)  # Last 12 quarters (3 years)
+        
+        for row in earnings.itertuples():
+            idx = row.Index
+            date_str = idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx)
+            quarter = self._get_quarter(idx)
             
-            for idx, row in earnings.iterrows():
-                date_str = idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx)
-                quarter = self._get_quarter(idx) if hasattr(idx, 'month') else ""
-                
-                eps_estimate = row.get('epsEstimate', None)
-                eps_actual = row.get('epsActual', None)
-                
-                surprise = None
-                surprise_pct = None
-                beat = None
-                
-                if eps_estimate is not None and eps_actual is not None:
-                    surprise = eps_actual - eps_estimate
-                    if eps_estimate != 0:
-                        surprise_pct = (surprise / abs(eps_estimate)) * 100
-                    beat = eps_actual > eps_estimate
-                
-                history.append(EarningsResult(
-                    date=date_str,
-                    quarter=quarter,
-                    eps_estimate=eps_estimate,
-                    eps_actual=eps_actual,
-                    surprise=surprise,
-                    surprise_pct=surprise_pct,
-                    beat=beat,
-                ))
+            eps_estimate = getattr(row, 'epsEstimate', None)
+            eps_actual = getattr(row, 'epsActual', None)
             
-            # Sort by date (newest first)
-            history.sort(key=lambda x: x.date, reverse=True)
+            surprise = None
+            surprise_pct = None
+            beat = None
             
-            return history[:12]  # Last 12 quarters (3 years)
+            if pd.notna(eps_estimate) and pd.notna(eps_actual):
+                surprise = eps_actual - eps_estimate
+                if eps_estimate != 0:
+                    surprise_pct = (surprise / abs(eps_estimate)) * 100
+                beat = eps_actual > eps_estimate
             
-        except Exception as e:
-            return []
+            history.append(EarningsResult(
+                date=date_str,
+                quarter=quarter,
+                eps_estimate=eps_estimate,
+                eps_actual=eps_actual,
+                surprise=surprise,
+                surprise_pct=surprise_pct,
+                beat=beat,
+            ))
+        
+        return history
     
     def _get_quarter(self, date) -> str:
         """Get quarter string from date."""
-        try:
-            if hasattr(date, 'month'):
-                month = date.month
-                year = date.year
-            else:
-                return ""
-            
-            if month <= 3:
-                return f"Q1 {year}"
-            elif month <= 6:
-                return f"Q2 {year}"
-            elif month <= 9:
-                return f"Q3 {year}"
-            else:
-                return f"Q4 {year}"
-        except:
+        if not hasattr(date, 'month'):
             return ""
+        
+        return f"Q{(date.month - 1) // 3 + 1} {date.year}"
     
     def _get_next_earnings(self) -> tuple:
         """Get next earnings date."""
         try:
             calendar = self.stock.calendar
-            
-            if calendar is None:
-                return None, None
-            
-            # Handle different calendar formats
-            if isinstance(calendar, dict):
-                earnings_date = calendar.get('Earnings Date', [None])[0]
+        except Exception:
+            return None, None
+        if calendar is None:
+            return None, None
+        
+        # Handle different calendar formats
+        if isinstance(calendar, dict):
+            raw_dates = calendar.get('Earnings Date') or []
+        else:
+            # DataFrame format
+            if 'Earnings Date' in calendar.columns:
+                raw_dates = calendar['Earnings Date']
+            elif 'Earnings Date' in calendar.index:
+                raw_dates = calendar.loc['Earnings Date']
             else:
-                # DataFrame format
-                if 'Earnings Date' in calendar.columns:
-                    earnings_date = calendar['Earnings Date'].iloc[0]
-                elif 'Earnings Date' in calendar.index:
-                    earnings_date = calendar.loc['Earnings Date'].iloc[0]
-                else:
-                    return None, None
-            
-            if earnings_date is None:
                 return None, None
-            
-            # Parse date
-            if hasattr(earnings_date, 'strftime'):
-                date_str = earnings_date.strftime('%Y-%m-%d')
-                days_until = (earnings_date - datetime.now()).days
-            else:
-                date_str = str(earnings_date)[:10]
-                try:
-                    dt = datetime.strptime(date_str, '%Y-%m-%d')
-                    days_until = (dt - datetime.now()).days
-                except:
-                    days_until = None
-            
-            return date_str, days_until
-            
-        except Exception as e:
+        
+        # Parse all candidate dates at once (Yahoo often gives a date range)
+        try:
+            dates = pd.DatetimeIndex(pd.to_datetime(raw_dates, errors='coerce')).dropna()
+        except (TypeError, ValueError):
             return None, None
+        if dates.empty:
+            return None, None
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        
+        # Earliest date that hasn't passed yet, else the most recent one
+        upcoming = dates[dates >= pd.Timestamp.today().normalize()]
+        earnings_date = upcoming.min() if len(upcoming) else dates.max()
+        
+        date_str = earnings_date.strftime('%Y-%m-%d')
+        days_until = (earnings_date - pd.Timestamp.now()).days
+        
+        return date_str, days_until
     
     def _calculate_streak(self, history: List[EarningsResult]) -> tuple:
         """Calculate current beat/miss streak."""
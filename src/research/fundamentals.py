@@ -11,13 +11,22 @@ Deep dive into company financials:
 This is the work others won't do. That's the edge.
 """
 
-import yfinance as yf
+import os
+import sys
+import math
 import pandas as pd
 from datetime import datetime
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.research.cache import get_ticker, load_cached, load_info, save_cached
+
+# Annual statements only change at filing time
+STATEMENT_CACHE_TTL = 7 * 24 * 3600
+
 
 @dataclass
 class FundamentalAnalysis:
@@ -76,16 +85,39 @@ class FundamentalAnalyzer:
     The goal: Understand the business, not just the stock.
     """
     
+    # Yahoo fields reported as fractions, shown as percentages
+    PCT_FIELDS = (
+        'revenueGrowth', 'earningsGrowth',
+        'grossMargins', 'operatingMargins', 'profitMargins',
+        'returnOnEquity', 'returnOnAssets',
+        'heldPercentInsiders', 'heldPercentInstitutions', 'shortPercentOfFloat',
+    )
+    
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
-        self.info = self.stock.info
+        self.stock = get_ticker(self.ticker)
+        self.info = load_info(self.ticker)
         self.analysis: Optional[FundamentalAnalysis] = None
     
+    def _load_financials(self) -> Optional[pd.DataFrame]:
+        """Annual income statement, served from the disk cache when fresh."""
+        financials = load_cached('financials', self.ticker, max_age=STATEMENT_CACHE_TTL)
+        if financials is None:
+            try:
+                financials = self.stock.financials
+            except Exception:
+                return None
+            if financials is not None and not financials.empty:
+                save_cached('financials', self.ticker, financials)
+        return financials
+    
     def analyze(self) -> FundamentalAnalysis:
         """Run complete fundamental analysis."""
         info = self.info
         
+        # Fraction fields (0.25 = 25%) read in one pass
+        pct = {key: (info.get(key) or 0) * 100 for key in self.PCT_FIELDS}
+        
         # Basic info
         name = info.get('shortName', self.ticker)
         sector = info.get('sector', 'Unknown')
@@ -94,33 +126,39 @@ class FundamentalAnalyzer:
         # Valuation metrics
         market_cap = info.get('marketCap', 0) / 1e9
         ev = info.get('enterpriseValue', 0) / 1e9
-        pe = info.get('trailingPE')
-        forward_pe = info.get('forwardPE')
-        ps = info.get('priceToSalesTrailing12Months')
-        pb = info.get('priceToBook')
-        ev_ebitda = info.get('enterpriseToEbitda')
+        pe = self._finite(info.get('trailingPE'))
+        forward_pe = self._finite(info.get('forwardPE'))
+        ps = self._finite(info.get('priceToSalesTrailing12Months'))
+        pb = self._finite(info.get('priceToBook'))
+        ev_ebitda = self._finite(info.get('enterpriseToEbitda'))
         
         # Growth metrics
-        revenue_growth = (info.get('revenueGrowth', 0) or 0) * 100
-        earnings_growth = (info.get('earningsGrowth', 0) or 0) * 100
+        revenue_growth = pct['revenueGrowth']
+        earnings_growth = pct['earningsGrowth']
+        
+        # Annual income statement, fetched once; each line item extracted once
+        financials = self._load_financials()
+        revenues = self._statement_row(financials, 'Total Revenue')
+        net_income = self._statement_row(financials, 'Net Income')
         
         # Calculate 3-year CAGR from financials
-        revenue_3yr_cagr = self._calculate_revenue_cagr()
+        revenue_3yr_cagr = self._calculate_revenue_cagr(revenues)
         
         # Profitability
-        gross_margin = (info.get('grossMargins', 0) or 0) * 100
-        operating_margin = (info.get('operatingMargins', 0) or 0) * 100
-        net_margin = (info.get('profitMargins', 0) or 0) * 100
-        roe = (info.get('returnOnEquity', 0) or 0) * 100
-        roa = (info.get('returnOnAssets', 0) or 0) * 100
+        gross_margin = pct['grossMargins']
+        operating_margin = pct['operatingMargins']
+        net_margin = pct['profitMargins']
+        roe = pct['returnOnEquity']
+        roa = pct['returnOnAssets']
         
         # Cash flow
-        fcf = info.get('freeCashflow', 0) / 1e9
+        fcf_raw = info.get('freeCashflow', 0)
+        fcf = fcf_raw / 1e9
         ocf = info.get('operatingCashflow', 0) / 1e9
         revenue = info.get('totalRevenue', 0)
         # Only calculate FCF margin if revenue is meaningful (> $1M)
         if revenue and revenue > 1_000_000:
-            fcf_margin = (info.get('freeCashflow', 0) / revenue * 100)
+            fcf_margin = (fcf_raw / revenue * 100)
         else:
             fcf_margin = 0  # Pre-revenue company
         
@@ -131,13 +169,13 @@ class FundamentalAnalyzer:
         current_ratio = info.get('currentRatio', 0) or 0
         
         # Quality metrics
-        insider_own = (info.get('heldPercentInsiders', 0) or 0) * 100
-        inst_own = (info.get('heldPercentInstitutions', 0) or 0) * 100
-        short_pct = (info.get('shortPercentOfFloat', 0) or 0) * 100
+        insider_own = pct['heldPercentInsiders']
+        inst_own = pct['heldPercentInstitutions']
+        short_pct = pct['shortPercentOfFloat']
         
         # Historical financials
-        revenue_history = self._get_revenue_history()
-        earnings_history = self._get_earnings_history()
+        revenue_history = self._get_revenue_history(revenues)
+        earnings_history = self._get_earnings_history(net_income)
         
         self.analysis = FundamentalAnalysis(
             ticker=self.ticker,
@@ -175,68 +213,49 @@ class FundamentalAnalyzer:
         
         return self.analysis
     
-    def _calculate_revenue_cagr(self) -> Optional[float]:
-        """Calculate 3-year revenue CAGR."""
+    def _finite(self, value) -> Optional[float]:
+        """Value as float if it's a finite number, else None (Yahoo sends 'Infinity'/NaN ratios)."""
         try:
-            financials = self.stock.financials
-            if financials is None or financials.empty:
-                return None
-            
-            if 'Total Revenue' in financials.index:
-                revenues = financials.loc['Total Revenue'].dropna()
-            else:
-                return None
-            
-            if len(revenues) < 3:
-                return None
-            
-            # Most recent and 3 years ago
-            current = revenues.iloc[0]
-            past = revenues.iloc[min(3, len(revenues)-1)]
-            
-            if past <= 0 or current <= 0:
-                return None
-            
-            years = min(3, len(revenues) - 1)
-            cagr = ((current / past) ** (1 / years) - 1) * 100
-            return cagr
-            
-        except Exception:
+            value = float(value)
+        except (TypeError, ValueError):
             return None
+        return value if math.isfinite(value) else None
     
-    def _get_revenue_history(self) -> List[Dict]:
+    def _statement_row(self, financials: Optional[pd.DataFrame], label: str) -> pd.Series:
+        """One line item from the income statement (newest year first), empty if missing."""
+        if financials is None or financials.empty or label not in financials.index:
+            return pd.Series(dtype=float)
+        return financials.loc[label].dropna()
+    
+    def _calculate_revenue_cagr(self, revenues: pd.Series) -> Optional[float]:
+        """Calculate 3-year revenue CAGR."""
+        if len(revenues) < 3:
+            return None
+        
+        # Most recent and 3 years ago
+        current = revenues.iloc[0]
+        past = revenues.iloc[min(3, len(revenues)-1)]
+        
+        if past <= 0 or current <= 0:
+            return None
+        
+        years = min(3, len(revenues) - 1)
+        cagr = ((current / past) ** (1 / years) - 1) * 100
+        return cagr
+    
+    def _get_revenue_history(self, revenues: pd.Series) -> List[Dict]:
         """Get historical revenue data."""
-        try:
-            financials = self.stock.financials
-            if financials is None or financials.empty:
-                return []
-            
-            if 'Total Revenue' in financials.index:
-                revenues = financials.loc['Total Revenue'].dropna()
-                return [
-                    {'year': str(date.year), 'revenue': float(val) / 1e9}
-                    for date, val in revenues.items()
-                ]
-            return []
-        except Exception:
-            return []
+        return [
+            {'year': str(date.year), 'revenue': float(val) / 1e9}
+            for date, val in revenues.items()
+        ]
     
-    def _get_earnings_history(self) -> List[Dict]:
+    def _get_earnings_history(self, earnings: pd.Series) -> List[Dict]:
         """Get historical earnings data."""
-        try:
-            financials = self.stock.financials
-            if financials is None or financials.empty:
-                return []
-            
-            if 'Net Income' in financials.index:
-                earnings = financials.loc['Net Income'].dropna()
-                return [
-                    {'year': str(date.year), 'earnings': float(val) / 1e9}
-                    for date, val in earnings.items()
-                ]
-            return []
-        except Exception:
-            return []
+        return [
+            {'year': str(date.year), 'earnings': float(val) / 1e9}
+            for date, val in earnings.items()
+        ]
     
     def get_quality_score(self) -> tuple[int, List[str]]:
         """Calculate fundamental quality score."""
@@ -13,20 +13,28 @@ Why this matters:
 
 import os
 import sys
-import requests
+import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 import json
-import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.sec import sec_get, sec_get_json, sec_json
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class InsiderTransaction:
     """A single insider transaction."""
+    # One per Form 4 line item across every scanned ticker
+    __slots__ = ('ticker', 'company_name', 'insider_name', 'insider_title',
+                 'transaction_type', 'shares', 'price', 'value', 'date',
+                 'filing_url')
+    
     ticker: str
     company_name: str
     insider_name: str
@@ -60,10 +68,11 @@ class InsiderTracker:
     The edge: Real-time data that GPT doesn't have.
     """
     
-    SEC_HEADERS = {
-        'User-Agent': 'Research Platform contact@example.com',
-        'Accept-Encoding': 'gzip, deflate',
-    }
+    # Form 4 or amended Form 4
+    FORM4_TYPES = frozenset({'4', '4/A'})
+    
+    # Ticker -> CIK, shared across instances (company_tickers.json is ~1MB)
+    _cik_map: Optional[Dict[str, str]] = None
     
     def __init__(self):
         self.cache = {}
@@ -96,33 +105,33 @@ class InsiderTracker:
             return transactions
             
         except Exception as e:
-            print(f"   Error fetching insider data for {ticker}: {e}")
+            logger.warning("Error fetching insider data for %s: %s", ticker, e)
             return []
     
     def _get_cik(self, ticker: str) -> Optional[str]:
         """Get company CIK number from ticker using SEC company tickers file."""
         try:
-            # Use SEC's official ticker-to-CIK mapping
-            if not hasattr(self, '_cik_map'):
+            # Use SEC's official ticker-to-CIK mapping (downloaded once per process)
+            if InsiderTracker._cik_map is None:
                 url = "https://www.sec.gov/files/company_tickers.json"
-                response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
+                data = sec_get_json(url, 'company_tickers')
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    # Build ticker -> CIK map
-                    self._cik_map = {}
-                    for entry in data.values():
-                        t = entry.get('ticker', '').upper()
-                        cik = str(entry.get('cik_str', ''))
-                        if t and cik:
-                            self._cik_map[t] = cik
-                else:
-                    self._cik_map = {}
+                if data is None:
+                    return None
+                
+                # Build ticker -> CIK map
+                cik_map = {}
+                for entry in data.values():
+                    t = entry.get('ticker', '').upper()
+                    cik = str(entry.get('cik_str', ''))
+                    if t and cik:
+                        cik_map[t] = cik
+                InsiderTracker._cik_map = cik_map
             
-            return self._cik_map.get(ticker.upper())
+            return InsiderTracker._cik_map.get(ticker.upper())
             
         except Exception as e:
-            print(f"   Error getting CIK: {e}")
+            logger.warning("Error getting CIK for %s: %s", ticker, e)
             return None
     
     def _get_form4_filings(self, cik: str, days: int) -> List[Dict]:
@@ -131,12 +140,11 @@ class InsiderTracker:
             # Use SEC EDGAR API
             url = f"https://data.sec.gov/submissions/CIK{cik.zfill(10)}.json"
             
-            response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
+            data = sec_get_json(url, f"submissions_{cik}")
             
-            if response.status_code != 200:
+            if data is None:
                 return []
             
-            data = response.json()
             filings = []
             
             # Get recent filings
@@ -147,15 +155,17 @@ class InsiderTracker:
             
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            for i, form in enumerate(forms):
-                if form in ['4', '4/A']:  # Form 4 or amended Form 4
-                    if i < len(dates) and dates[i] >= cutoff_date:
-                        filings.append({
-                            'form': form,
-                            'date': dates[i],
-                            'accession': accessions[i] if i < len(accessions) else None,
-                            'cik': cik,
-                        })
+            for form, date, accession in zip(forms, dates, accessions):
+                # Filings are listed newest-first: stop at the first one past the window
+                if date < cutoff_date:
+                    break
+                if form in self.FORM4_TYPES:
+                    filings.append({
+                        'form': form,
+                        'date': date,
+                        'accession': accession,
+                        'cik': cik,
+                    })
             
             return filings
             
@@ -172,21 +182,24 @@ class InsiderTracker:
             
             # First, get the directory listing to find the XML file
             index_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/index.json"
-            index_response = requests.get(index_url, headers=self.SEC_HEADERS, timeout=10)
+            index_response = sec_get(index_url)
             
             if index_response.status_code != 200:
                 return []
             
             # Find the Form 4 XML file
             xml_filename = None
-            files = index_response.json().get('directory', {}).get('item', [])
+            files = sec_json(index_response).get('directory', {}).get('item', [])
             for f in files:
                 name = f.get('name', '')
-                if name.endswith('.xml') and 'form4' in name.lower():
+                if not name.endswith('.xml'):
+                    continue
+                name_lower = name.lower()
+                if 'form4' in name_lower:
                     xml_filename = name
                     break
                 # Also check for standard naming
-                if name.endswith('.xml') and 'index' not in name.lower():
+                if 'index' not in name_lower:
                     xml_filename = name
             
             if not xml_filename:
@@ -194,7 +207,7 @@ class InsiderTracker:
             
             # Get the XML file
             url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{xml_filename}"
-            response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
+            response = sec_get(url)
             
             if response.status_code != 200:
                 return []
@@ -399,8 +412,6 @@ class InsiderTracker:
                 if summary.total_buys_30d >= min_buys and summary.buy_value_30d >= min_value:
                     results.append(summary)
                     print(f"   ✅ {ticker}: {summary.total_buys_30d} buys (${summary.buy_value_30d:,.0f})")
-            
-            time.sleep(0.5)  # Rate limiting for SEC
         
         # Sort by buy value
         results.sort(key=lambda x: x.buy_value_30d, reverse=True)
@@ -429,16 +440,22 @@ def scan_watchlist_for_insiders(tickers: List[str]):
     results = tracker.scan_for_buying(tickers)
     
     if results:
-        print("\n" + "═" * 50)
-        print("🔔 INSIDER BUYING DETECTED")
-        print("═" * 50)
+        lines = [
+            "",
+            "═" * 50,
+            "🔔 INSIDER BUYING DETECTED",
+            "═" * 50,
+        ]
         
         for summary in results[:10]:
-            print(f"\n{summary.signal}")
-            print(f"   {summary.ticker}: {summary.total_buys_30d} buys (${summary.buy_value_30d:,.0f})")
+            lines.append("")
+            lines.append(summary.signal)
+            lines.append(f"   {summary.ticker}: {summary.total_buys_30d} buys (${summary.buy_value_30d:,.0f})")
             
             for txn in summary.recent_transactions[:2]:
-                print(f"   • {txn.insider_title} bought ${txn.value:,.0f}")
+                lines.append(f"   • {txn.insider_title} bought ${txn.value:,.0f}")
+        
+        print("\n".join(lines))
     else:
         print("\n   No significant insider buying detected")
 
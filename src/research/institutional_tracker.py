@@ -19,11 +19,17 @@ import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-import json
-import time
+import re
+from bisect import bisect_right
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker, load_cached, save_cached
+from src.research.sec import sec_get, sec_get_json, sec_json
+
 
 # Well-known institutions to track
 NOTABLE_INSTITUTIONS = {
@@ -52,10 +58,74 @@ NOTABLE_INSTITUTIONS = {
     '1466857': 'Altimeter Capital',
 }
 
+# Common CUSIP to ticker mappings for major stocks
+KNOWN_CUSIPS = {
+    '037833100': 'AAPL',  # Apple
+    '594918104': 'MSFT',  # Microsoft
+    '02079K305': 'GOOG',  # Alphabet Class C
+    '02079K107': 'GOOGL', # Alphabet Class A
+    '023135106': 'AMZN',  # Amazon
+    '88160R101': 'TSLA',  # Tesla
+    '30303M102': 'META',  # Meta
+    '67066G104': 'NVDA',  # NVIDIA
+    '11135F101': 'BRK.B', # Berkshire
+    '478160104': 'JNJ',   # Johnson & Johnson
+    '91324P102': 'UNH',   # UnitedHealth
+    '92826C839': 'V',     # Visa
+    '254687106': 'DIS',   # Disney
+    '742718109': 'PG',    # Procter & Gamble
+    '46625H100': 'JPM',   # JPMorgan
+    '17275R102': 'CSCO',  # Cisco
+    '00206R102': 'T',     # AT&T
+    '931142103': 'WMT',   # Walmart
+    '60871R209': 'MRK',   # Merck
+    '713448108': 'PEP',   # PepsiCo
+}
+
+# Issuer name fragments for stocks without a known CUSIP (checked in order)
+NAME_TO_TICKER = {
+    'APPLE': 'AAPL',
+    'MICROSOFT': 'MSFT',
+    'ALPHABET': 'GOOGL',
+    'AMAZON': 'AMZN',
+    'TESLA': 'TSLA',
+    'META PLATFORMS': 'META',
+    'NVIDIA': 'NVDA',
+    'BERKSHIRE': 'BRK.B',
+    'JOHNSON': 'JNJ',
+    'UNITEDHEALTH': 'UNH',
+    'VISA': 'V',
+    'DISNEY': 'DIS',
+    'PROCTER': 'PG',
+    'JPMORGAN': 'JPM',
+    'CISCO': 'CSCO',
+    'WALMART': 'WMT',
+    'PEPSICO': 'PEP',
+}
+
+# Words skipped when picking the company-name search term
+NAME_SKIP_WORDS = frozenset({
+    'INC', 'INC.', 'CORP', 'CORP.', 'LTD', 'LTD.', 'CO', 'CO.',
+    'LLC', 'LP', 'PLC', 'THE', 'A', 'AN', 'OF', 'AND', '&',
+})
+
+# Suffixes that may follow the search term in a 13F issuer name
+ISSUER_SUFFIXES = (' INC', ' CORP', ' CO', ' LTD', ' LLC', ' PLC', ' CLASS')
+
+# Punctuation dropped from issuer names before matching
+_ISSUER_PUNCTUATION = str.maketrans('', '', '.,')
+
+# Any of the name fragments, as one pattern for a quick "no match" check
+_NAME_PATTERN = re.compile('|'.join(re.escape(name) for name in NAME_TO_TICKER))
+
 
 @dataclass
 class InstitutionalHolding:
     """A single institutional holding from 13F."""
+    # One per position per filing - slots keep thousands of them compact
+    __slots__ = ('institution_name', 'institution_cik', 'ticker', 'company_name',
+                 'shares', 'value', 'filing_date', 'report_date')
+    
     institution_name: str
     institution_cik: str
     ticker: str
@@ -69,6 +139,9 @@ class InstitutionalHolding:
 @dataclass
 class InstitutionalChange:
     """Change in institutional holdings between quarters."""
+    __slots__ = ('institution_name', 'ticker', 'prev_shares', 'curr_shares',
+                 'change_shares', 'change_pct', 'action', 'value')
+    
     institution_name: str
     ticker: str
     prev_shares: int
@@ -100,24 +173,37 @@ class InstitutionalTracker:
     The edge: See what big money is doing before retail.
     """
     
-    SEC_HEADERS = {
-        'User-Agent': 'Research Platform contact@example.com',
-        'Accept-Encoding': 'gzip, deflate',
-    }
+    # infoTable fields used for matching holdings (all that's kept in the cache)
+    INFO_TABLE_FIELDS = ('nameOfIssuer', 'cusip', 'value', 'sshPrnamt')
+    INFO_TABLE_FILENAME = 'form13fInfoTable.xml'
+    
+    # EDGAR endpoints: submissions take the 10-digit padded CIK, archive
+    # paths the bare CIK (as stored in NOTABLE_INSTITUTIONS) and accession
+    TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+    SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{:0>10}.json"
+    ARCHIVE_URL = "https://www.sec.gov/Archives/edgar/data/{}/{}/{}"
+    
+    # Institutions checked concurrently (sec_get enforces SEC's rate limit)
+    SCAN_WORKERS = 4
+    
+    # Dollar-value display bands: below $1M as K, below $1B as M, else B
+    VALUE_SCALE_CUTOFFS = (1e6, 1e9)
+    VALUE_SCALES = ((1e3, "${:.0f}K"), (1e6, "${:.1f}M"), (1e9, "${:.1f}B"))
     
     def __init__(self):
         self._cik_map = None
         self._ticker_to_cusip = {}
+        self._submissions = {}
+        self._name_prefixes = {}
+        self._prefix_lock = threading.Lock()
     
     def _get_cik_map(self) -> Dict[str, str]:
         """Load ticker to CIK mapping."""
         if self._cik_map is None:
             try:
-                url = "https://www.sec.gov/files/company_tickers.json"
-                response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
+                data = sec_get_json(self.TICKERS_URL, 'company_tickers')
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data is not None:
                     self._cik_map = {}
                     for entry in data.values():
                         t = entry.get('ticker', '').upper()
@@ -133,35 +219,42 @@ class InstitutionalTracker:
     
     def get_recent_13f_filings(self, institution_cik: str, count: int = 2) -> List[Dict]:
         """Get recent 13F filings for an institution."""
-        try:
-            url = f"https://data.sec.gov/submissions/CIK{institution_cik.zfill(10)}.json"
-            response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            filings = []
-            
-            recent = data.get('filings', {}).get('recent', {})
-            forms = recent.get('form', [])
-            dates = recent.get('filingDate', [])
-            accessions = recent.get('accessionNumber', [])
-            
-            for i, form in enumerate(forms):
-                if form in ['13F-HR', '13F-HR/A']:
-                    if len(filings) < count:
-                        filings.append({
-                            'form': form,
-                            'date': dates[i] if i < len(dates) else '',
-                            'accession': accessions[i] if i < len(accessions) else '',
-                            'cik': institution_cik,
-                        })
-            
-            return filings
-            
-        except Exception as e:
+        recent = self._get_recent_submissions(institution_cik)
+        if recent is None:
             return []
+        
+        forms = recent.get('form', [])
+        dates = recent.get('filingDate', [])
+        accessions = recent.get('accessionNumber', [])
+        
+        # Feed is newest-first, so the first `count` 13F indices are the latest
+        indices = [i for i, form in enumerate(forms) if form in ('13F-HR', '13F-HR/A')][:count]
+        
+        return [
+            {
+                'form': forms[i],
+                'date': dates[i] if i < len(dates) else '',
+                'accession': accessions[i] if i < len(accessions) else '',
+                'cik': institution_cik,
+            }
+            for i in indices
+        ]
+    
+    def _get_recent_submissions(self, institution_cik: str) -> Optional[Dict]:
+        """Fetch the 'recent' filings block for a CIK (memoized for the tracker's lifetime)."""
+        if institution_cik not in self._submissions:
+            try:
+                data = sec_get_json(self.SUBMISSIONS_URL.format(institution_cik),
+                                    f"submissions_{institution_cik}")
+                
+                if data is None:
+                    return None
+                
+                self._submissions[institution_cik] = data.get('filings', {}).get('recent', {})
+            except Exception:
+                return None
+        
+        return self._submissions[institution_cik]
     
     def parse_13f_holdings(self, filing: Dict) -> Dict[str, InstitutionalHolding]:
         """Parse a 13F filing to extract holdings."""
@@ -169,57 +262,25 @@ class InstitutionalTracker:
         
         try:
             cik = filing['cik']
-            accession = filing['accession'].replace('-', '')
-            
-            # Get directory listing
-            index_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/index.json"
-            index_response = requests.get(index_url, headers=self.SEC_HEADERS, timeout=10)
             
-            if index_response.status_code != 200:
+            # Get the holdings table
+            entries = self._load_info_tables(filing)
+            if not entries:
                 return holdings
             
-            # Find the infotable XML file (contains holdings)
-            xml_filename = None
-            files = index_response.json().get('directory', {}).get('item', [])
-            for f in files:
-                name = f.get('name', '').lower()
-                if 'infotable' in name and name.endswith('.xml'):
-                    xml_filename = f.get('name')
-                    break
-            
-            if not xml_filename:
-                return holdings
-            
-            # Get the holdings XML
-            url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{xml_filename}"
-            response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
-            
-            if response.status_code != 200:
-                return holdings
-            
-            # Parse XML
-            # Remove namespace for easier parsing
-            content = response.text
-            content = content.replace('xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable"', '')
-            
-            root = ET.fromstring(content)
-            
             institution_name = NOTABLE_INSTITUTIONS.get(cik, f"CIK {cik}")
             
-            for info_table in root.findall('.//infoTable'):
+            for entry in entries:
                 try:
-                    name_elem = info_table.find('nameOfIssuer')
-                    cusip_elem = info_table.find('cusip')
-                    shares_elem = info_table.find('.//sshPrnamt')
-                    value_elem = info_table.find('value')
+                    company_name = entry.get('nameOfIssuer')
+                    shares_text = entry.get('sshPrnamt')
                     
-                    if name_elem is None or shares_elem is None:
+                    if company_name is None or shares_text is None:
                         continue
                     
-                    company_name = name_elem.text or ''
-                    cusip = cusip_elem.text if cusip_elem is not None else ''
-                    shares = int(shares_elem.text) if shares_elem.text else 0
-                    value = int(value_elem.text) if value_elem is not None and value_elem.text else 0
+                    cusip = entry.get('cusip', '')
+                    shares = int(shares_text) if shares_text else 0
+                    value = int(entry['value']) if entry.get('value') else 0
                     
                     # Try to get ticker from CUSIP
                     ticker = self._cusip_to_ticker(cusip, company_name)
@@ -244,63 +305,106 @@ class InstitutionalTracker:
         except Exception as e:
             return holdings
     
+    def _load_info_tables(self, filing: Dict) -> List[Dict[str, str]]:
+        """
+        Holdings entries of a filing, cached on disk by accession number.
+        
+        A filed 13F never changes, so each one is downloaded and parsed once.
+        """
+        key = f"{filing['cik']}_{filing['accession']}"
+        entries = load_cached('13f', key)
+        if entries is not None:
+            return entries
+        
+        response = self._open_info_table(filing)
+        if response is None:
+            return []
+        
+        entries = list(self._iter_info_tables(response))
+        save_cached('13f', key, entries)
+        return entries
+    
+    def _open_info_table(self, filing: Dict) -> Optional[requests.Response]:
+        """Open a filing's information table XML as a streaming response (None if missing)."""
+        cik = filing['cik']
+        accession = filing['accession'].replace('-', '')
+        
+        # Most filers use the standard filename, which saves the index lookup
+        response = sec_get(
+            self.ARCHIVE_URL.format(cik, accession, self.INFO_TABLE_FILENAME), stream=True
+        )
+        if response.status_code == 200:
+            return response
+        response.close()
+        
+        # Otherwise find it from the directory listing
+        index_response = sec_get(self.ARCHIVE_URL.format(cik, accession, 'index.json'))
+        
+        if index_response.status_code != 200:
+            return None
+        
+        # Find the infotable XML file (contains holdings)
+        xml_filename = None
+        files = sec_json(index_response).get('directory', {}).get('item', [])
+        for f in files:
+            name = f.get('name', '').lower()
+            if 'infotable' in name and name.endswith('.xml'):
+                xml_filename = f.get('name')
+                break
+        
+        if not xml_filename:
+            return None
+        
+        response = sec_get(self.ARCHIVE_URL.format(cik, accession, xml_filename), stream=True)
+        
+        if response.status_code != 200:
+            response.close()
+            return None
+        
+        return response
+    
+    def _iter_info_tables(self, response: requests.Response):
+        """
+        Yield each <infoTable> entry of a 13F information table as {field: text}.
+        
+        Parses the streaming response body as it downloads and looks fields up
+        with {*} namespace wildcards, so the namespace/prefix a filer used
+        doesn't matter. Only INFO_TABLE_FIELDS are read, and entries are
+        cleared once read to keep memory flat on filings with thousands of
+        positions. The response is closed when iteration ends.
+        """
+        field_paths = [(tag, f".//{{*}}{tag}") for tag in self.INFO_TABLE_FIELDS]
+        
+        response.raw.decode_content = True  # Undo gzip while reading
+        try:
+            for _, elem in ET.iterparse(response.raw, events=('end',)):
+                if elem.tag.rsplit('}', 1)[-1] != 'infoTable':
+                    continue
+                fields = {}
+                for tag, path in field_paths:
+                    text = elem.findtext(path)
+                    if text is not None:
+                        fields[tag] = text.strip()
+                elem.clear()
+                yield fields
+        finally:
+            response.close()
+    
     def _cusip_to_ticker(self, cusip: str, company_name: str) -> Optional[str]:
         """Convert CUSIP to ticker symbol."""
         # Check cache
         if cusip in self._ticker_to_cusip:
             return self._ticker_to_cusip[cusip]
         
-        # Common CUSIP to ticker mappings for major stocks
-        KNOWN_CUSIPS = {
-            '037833100': 'AAPL',  # Apple
-            '594918104': 'MSFT',  # Microsoft
-            '02079K305': 'GOOG',  # Alphabet Class C
-            '02079K107': 'GOOGL', # Alphabet Class A
-            '023135106': 'AMZN',  # Amazon
-            '88160R101': 'TSLA',  # Tesla
-            '30303M102': 'META',  # Meta
-            '67066G104': 'NVDA',  # NVIDIA
-            '11135F101': 'BRK.B', # Berkshire
-            '478160104': 'JNJ',   # Johnson & Johnson
-            '91324P102': 'UNH',   # UnitedHealth
-            '92826C839': 'V',     # Visa
-            '254687106': 'DIS',   # Disney
-            '742718109': 'PG',    # Procter & Gamble
-            '46625H100': 'JPM',   # JPMorgan
-            '17275R102': 'CSCO',  # Cisco
-            '00206R102': 'T',     # AT&T
-            '931142103': 'WMT',   # Walmart
-            '60871R209': 'MRK',   # Merck
-            '713448108': 'PEP',   # PepsiCo
-        }
-        
         if cusip in KNOWN_CUSIPS:
             ticker = KNOWN_CUSIPS[cusip]
             self._ticker_to_cusip[cusip] = ticker
             return ticker
         
-        # Try to match by company name
+        # Try to match by company name (most issuers match none - reject those in one scan)
         company_upper = company_name.upper()
-        
-        NAME_TO_TICKER = {
-            'APPLE': 'AAPL',
-            'MICROSOFT': 'MSFT',
-            'ALPHABET': 'GOOGL',
-            'AMAZON': 'AMZN',
-            'TESLA': 'TSLA',
-            'META PLATFORMS': 'META',
-            'NVIDIA': 'NVDA',
-            'BERKSHIRE': 'BRK.B',
-            'JOHNSON': 'JNJ',
-            'UNITEDHEALTH': 'UNH',
-            'VISA': 'V',
-            'DISNEY': 'DIS',
-            'PROCTER': 'PG',
-            'JPMORGAN': 'JPM',
-            'CISCO': 'CSCO',
-            'WALMART': 'WMT',
-            'PEPSICO': 'PEP',
-        }
+        if not _NAME_PATTERN.search(company_upper):
+            return None
         
         for name_part, ticker in NAME_TO_TICKER.items():
             if name_part in company_upper:
@@ -309,23 +413,22 @@ class InstitutionalTracker:
         
         return None
     
-    def _find_ticker_in_13f(self, filing: Dict, target_ticker: str) -> Optional[Tuple[int, int, str]]:
+    def _issuer_name_prefixes(self, target_ticker: str) -> Tuple[str, ...]:
         """
-        Search a 13F filing for a specific ticker by company name.
-        Returns (shares, value, company_name) if found.
+        Issuer-name prefixes that identify a ticker in 13F filings.
+        
+        Built from the company name once per ticker; every fund/filing checked
+        for that ticker reuses it instead of re-fetching the company info.
         """
-        try:
-            import yfinance as yf
+        with self._prefix_lock:
+            if target_ticker in self._name_prefixes:
+                return self._name_prefixes[target_ticker]
             
             # Get company name for the target ticker
-            stock = yf.Ticker(target_ticker)
-            info = stock.info
+            info = get_ticker(target_ticker).info
             company_name = info.get('shortName', info.get('longName', target_ticker))
             
             # Get the words to search for
-            SKIP_WORDS = {'INC', 'INC.', 'CORP', 'CORP.', 'LTD', 'LTD.', 'CO', 'CO.', 
-                          'LLC', 'LP', 'PLC', 'THE', 'A', 'AN', 'OF', 'AND', '&'}
-            
             search_terms = [target_ticker.upper()]
             if company_name:
                 # Add company name words (first meaningful word)
@@ -333,87 +436,110 @@ class InstitutionalTracker:
                 for word in name_words:
                     # Clean punctuation
                     word_clean = word.rstrip('.,')
-                    if word_clean not in SKIP_WORDS and len(word_clean) >= 3:
+                    if word_clean not in NAME_SKIP_WORDS and len(word_clean) >= 3:
                         search_terms.append(word_clean)
                         break  # Just take the first meaningful word
             
-            # Parse the 13F
-            cik = filing['cik']
-            accession = filing['accession'].replace('-', '')
-            
-            index_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/index.json"
-            index_response = requests.get(index_url, headers=self.SEC_HEADERS, timeout=10)
+            # Issuer names must start with a search term plus a corporate suffix
+            # e.g., "APPLE INC" should match "APPLE INC" but not "APPLE HOSPITALITY"
+            name_prefixes = tuple(
+                term + suffix
+                for term in search_terms if term != target_ticker
+                for suffix in ISSUER_SUFFIXES
+            )
+            self._name_prefixes[target_ticker] = name_prefixes
+            return name_prefixes
+    
+    def _find_ticker_in_13f(self, filing: Dict, target_ticker: str) -> Optional[Tuple[int, int, str]]:
+        """
+        Search a 13F filing for a specific ticker by company name.
+        Returns (shares, value, company_name) if found.
+        """
+        try:
+            name_prefixes = self._issuer_name_prefixes(target_ticker)
             
-            if index_response.status_code != 200:
+            # Parse the 13F
+            entries = self._load_info_tables(filing)
+            if not entries:
                 return None
             
-            xml_filename = None
-            files = index_response.json().get('directory', {}).get('item', [])
-            for f in files:
-                name = f.get('name', '').lower()
-                if 'infotable' in name and name.endswith('.xml'):
-                    xml_filename = f.get('name')
-                    break
+            for entry in entries:
+                found_name = entry.get('nameOfIssuer')
+                if found_name is None:
+                    continue
+                
+                # Clean issuer name for comparison
+                issuer_clean = found_name.upper().translate(_ISSUER_PUNCTUATION)
+                
+                # Check if this is the company we're looking for:
+                # ticker appears (e.g., "AAPL" in "AAPL INC") OR name starts with our search
+                if target_ticker in issuer_clean or issuer_clean.startswith(name_prefixes):
+                    shares = int(entry['sshPrnamt']) if entry.get('sshPrnamt') else 0
+                    value = int(entry['value']) if entry.get('value') else 0
+                    
+                    if shares > 0:
+                        return (shares, value, found_name)
             
-            if not xml_filename:
-                return None
+            return None
             
-            url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{xml_filename}"
-            response = requests.get(url, headers=self.SEC_HEADERS, timeout=10)
+        except Exception as e:
+            return None
+    
+    def _check_institution(self, inst_cik: str, inst_name: str, ticker: str) -> Optional[InstitutionalChange]:
+        """Compare a ticker's position in an institution's last two 13Fs (None if unchanged/absent)."""
+        try:
+            # Get last 2 filings
+            filings = self.get_recent_13f_filings(inst_cik, count=2)
             
-            if response.status_code != 200:
+            if len(filings) < 1:
                 return None
             
-            content = response.text
-            content = content.replace('xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable"', '')
-            
-            root = ET.fromstring(content)
+            # Search for the ticker in the filing
+            current_result = self._find_ticker_in_13f(filings[0], ticker)
             
-            for info_table in root.findall('.//infoTable'):
-                name_elem = info_table.find('nameOfIssuer')
-                if name_elem is None:
-                    continue
+            if current_result:
+                curr_shares, curr_value, _ = current_result
                 
-                issuer_name = (name_elem.text or '').upper()
+                # Check previous quarter
+                prev_shares = 0
+                if len(filings) >= 2:
+                    prev_result = self._find_ticker_in_13f(filings[1], ticker)
+                    if prev_result:
+                        prev_shares = prev_result[0]
                 
-                # Check if this is the company we're looking for
-                # Match ticker exactly OR company name starts exactly with our search
-                matched = False
+                change_shares = curr_shares - prev_shares
                 
-                # Clean issuer name for comparison
-                issuer_clean = issuer_name.replace('.', '').replace(',', '')
+                if prev_shares > 0:
+                    change_pct = (change_shares / prev_shares) * 100
+                else:
+                    change_pct = 100  # New position
                 
-                # Check if ticker matches (e.g., "AAPL" in "AAPL INC")
-                if target_ticker in issuer_clean:
-                    matched = True
+                # Determine action
+                if prev_shares == 0:
+                    action = "NEW"
+                elif change_shares > 0:
+                    action = "ADDED"
+                elif change_shares < 0:
+                    action = "REDUCED"
                 else:
-                    # Check if the issuer name starts with company name
-                    # e.g., "APPLE INC" should match "APPLE INC" but not "APPLE HOSPITALITY"
-                    for term in search_terms:
-                        if term == target_ticker:
-                            continue  # Skip ticker, check names
-                        # Issuer should start with the term followed by common suffixes
-                        for suffix in [' INC', ' CORP', ' CO', ' LTD', ' LLC', ' PLC', ' CLASS']:
-                            if issuer_clean.startswith(term + suffix):
-                                matched = True
-                                break
-                        if matched:
-                            break
+                    action = "HELD"
                 
-                if matched:
-                    shares_elem = info_table.find('.//sshPrnamt')
-                    value_elem = info_table.find('value')
-                    
-                    shares = int(shares_elem.text) if shares_elem is not None and shares_elem.text else 0
-                    value = int(value_elem.text) if value_elem is not None and value_elem.text else 0
-                    
-                    if shares > 0:
-                        return (shares, value, name_elem.text)
-            
-            return None
-            
-        except Exception as e:
+                if action != "HELD":
+                    return InstitutionalChange(
+                        institution_name=inst_name,
+                        ticker=ticker,
+                        prev_shares=prev_shares,
+                        curr_shares=curr_shares,
+                        change_shares=change_shares,
+                        change_pct=change_pct,
+                        action=action,
+                        value=curr_value,
+                    )
+        
+        except Exception:
             return None
+        
+        return None
     
     def get_institutional_activity(self, ticker: str) -> Optional[InstitutionalSummary]:
         """
@@ -424,80 +550,34 @@ class InstitutionalTracker:
         """
         ticker = ticker.upper()
         changes = []
-        company_name = ticker
         
         print(f"   Checking {len(NOTABLE_INSTITUTIONS)} major institutions...")
         
-        checked = 0
-        for inst_cik, inst_name in list(NOTABLE_INSTITUTIONS.items())[:15]:  # Check top 15
-            try:
-                checked += 1
+        institutions = list(NOTABLE_INSTITUTIONS.items())[:15]  # Check top 15
+        
+        # Funds are checked concurrently; sec_get keeps the combined request
+        # rate under SEC's limit
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            results = pool.map(
+                lambda inst: self._check_institution(inst[0], inst[1], ticker), institutions
+            )
+            for checked, change in enumerate(results, 1):
                 if checked % 5 == 0:
-                    print(f"   Progress: {checked}/{min(15, len(NOTABLE_INSTITUTIONS))}...")
+                    print(f"   Progress: {checked}/{len(institutions)}...")
                 
-                # Get last 2 filings
-                filings = self.get_recent_13f_filings(inst_cik, count=2)
-                
-                if len(filings) < 1:
-                    continue
-                
-                # Search for the ticker in the filing
-                current_result = self._find_ticker_in_13f(filings[0], ticker)
-                
-                if current_result:
-                    curr_shares, curr_value, found_name = current_result
-                    company_name = found_name or ticker
-                    
-                    # Check previous quarter
-                    prev_shares = 0
-                    if len(filings) >= 2:
-                        prev_result = self._find_ticker_in_13f(filings[1], ticker)
-                        if prev_result:
-                            prev_shares = prev_result[0]
-                    
-                    change_shares = curr_shares - prev_shares
-                    
-                    if prev_shares > 0:
-                        change_pct = (change_shares / prev_shares) * 100
-                    else:
-                        change_pct = 100  # New position
-                    
-                    # Determine action
-                    if prev_shares == 0:
-                        action = "NEW"
-                    elif change_shares > 0:
-                        action = "ADDED"
-                    elif change_shares < 0:
-                        action = "REDUCED"
-                    else:
-                        action = "HELD"
-                    
-                    if action != "HELD":
-                        changes.append(InstitutionalChange(
-                            institution_name=inst_name,
-                            ticker=ticker,
-                            prev_shares=prev_shares,
-                            curr_shares=curr_shares,
-                            change_shares=change_shares,
-                            change_pct=change_pct,
-                            action=action,
-                            value=curr_value,
-                        ))
-                        print(f"   ✅ Found in {inst_name}: {curr_shares:,} shares")
-                
-                time.sleep(0.3)  # Rate limiting
-                
-            except Exception:
-                continue
+                if change:
+                    changes.append(change)
+                    print(f"   ✅ Found in {change.institution_name}: {change.curr_shares:,} shares")
         
         if not changes:
             return None
         
         # Calculate summary
-        new_positions = len([c for c in changes if c.action == "NEW"])
-        increased = len([c for c in changes if c.action == "ADDED"])
-        decreased = len([c for c in changes if c.action == "REDUCED"])
-        sold = len([c for c in changes if c.action == "SOLD"])
+        actions = Counter(c.action for c in changes)
+        new_positions = actions["NEW"]
+        increased = actions["ADDED"]
+        decreased = actions["REDUCED"]
+        sold = actions["SOLD"]
         
         # Determine signal
         if new_positions >= 2 or (new_positions + increased) >= 3:
@@ -524,6 +604,11 @@ class InstitutionalTracker:
             signal=signal,
         )
     
+    def _format_value(self, value: float) -> str:
+        """Format a dollar value (13F values appear to be in actual dollars) as $K/$M/$B."""
+        divisor, fmt = self.VALUE_SCALES[bisect_right(self.VALUE_SCALE_CUTOFFS, value)]
+        return fmt.format(value / divisor)
+    
     def format_summary(self, summary: InstitutionalSummary) -> str:
         """Format institutional summary for display."""
         lines = [
@@ -559,17 +644,8 @@ class InstitutionalTracker:
                     emoji = "❌"
                     desc = "SOLD"
                 
-                # Value appears to be in actual dollars
-                value_m = change.value / 1_000_000
-                if value_m >= 1000:
-                    value_str = f"${value_m/1000:.1f}B"
-                elif value_m >= 1:
-                    value_str = f"${value_m:.1f}M"
-                else:
-                    value_str = f"${change.value/1000:.0f}K"
-                
                 lines.append(f"  {emoji} {change.institution_name}")
-                lines.append(f"     {desc} ({change.curr_shares:,} shares, {value_str})")
+                lines.append(f"     {desc} ({change.curr_shares:,} shares, {self._format_value(change.value)})")
                 lines.append("")
         
         lines.append("═" * 50)
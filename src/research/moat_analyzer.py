@@ -7,11 +7,19 @@ Numbers tell you growth. GPT tells you if it's real.
 """
 
 import os
+import sys
 import json
+import logging
 from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 from openai import OpenAI
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.research.cache import load_info
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class MoatAnalysis:
@@ -254,7 +262,7 @@ JSON only, no other text:"""
             )
             
         except Exception as e:
-            print(f"   GPT error for {ticker}: {e}")
+            logger.warning("GPT error for %s: %s", ticker, e)
             return None
     
     def format_analysis(self, analysis: MoatAnalysis) -> str:
@@ -313,10 +321,7 @@ JSON only, no other text:"""
 
 def analyze_moat(ticker: str) -> Optional[MoatAnalysis]:
     """Quick function to analyze a single ticker."""
-    import yfinance as yf
-    
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    info = load_info(ticker)
     
     analyzer = MoatAnalyzer()
     return analyzer.analyze(
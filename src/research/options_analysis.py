@@ -11,14 +11,18 @@ Why this matters:
 
 import os
 import sys
-from datetime import datetime, timedelta
+import math
+from bisect import bisect_left
+from datetime import date, timedelta
 from typing import Optional, List, Dict
 from dataclasses import dataclass
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker
+
 
 @dataclass
 class OptionsData:
@@ -33,6 +37,7 @@ class OptionsData:
     iv_rank: Optional[float]  # (current - low) / (high - low)
     iv_52w_high: Optional[float]
     iv_52w_low: Optional[float]
+    implied_move_pct: Optional[float]  # 1-sigma move to ~30d expiry (IV * sqrt(T))
     
     # Historical volatility (realized)
     hv_30d: Optional[float]  # 30-day historical volatility
@@ -55,10 +60,52 @@ class OptionsAnalyzer:
     Analyze options for IV percentile and LEAPS timing.
     """
     
+    # Concurrent option chain downloads (one request per expiration)
+    CHAIN_WORKERS = 6
+    
+    # IV percentile bands (upper bounds, inclusive) -> signal for each band
+    IV_BAND_LIMITS = (20, 40, 60, 80)
+    IV_SIGNALS = (
+        "🟢 IV Very Low - Options CHEAP",
+        "🟢 IV Low - Good time to buy options",
+        "🟡 IV Average",
+        "🟠 IV High - Options expensive",
+        "🔴 IV Very High - Options EXPENSIVE",
+    )
+    
+    # LEAPS timing uses slightly different bands
+    LEAPS_BAND_LIMITS = (25, 40, 60, 80)
+    LEAPS_SIGNALS = (
+        ("🟢 EXCELLENT time to buy LEAPS", "IV is historically low"),
+        ("🟢 GOOD time to buy LEAPS",),
+        ("🟡 NEUTRAL - Wait for lower IV if possible",),
+        ("🟠 AVOID buying LEAPS now", "IV is elevated"),
+        ("🔴 BAD time to buy LEAPS", "IV is very high - options overpriced"),
+    )
+    
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
+        self._chains: Dict[str, object] = {}
+    
+    def _option_chains(self, expirations: List[str]) -> Dict[str, object]:
+        """Option chains by expiration, downloaded concurrently and kept for reuse."""
+        missing = [exp for exp in dict.fromkeys(expirations) if exp not in self._chains]
+        
+        def load(exp: str):
+            try:
+                return self.stock.option_chain(exp)
+            except Exception:
+                return None
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.CHAIN_WORKERS) as pool:
+                for exp, chain in zip(missing, pool.map(load, missing)):
+                    if chain is not None:
+                        self._chains[exp] = chain
+        
+        return {exp: self._chains[exp] for exp in expirations if exp in self._chains}
     
     def analyze(self) -> OptionsData:
         """Run full options analysis."""
@@ -93,6 +140,7 @@ class OptionsAnalyzer:
             iv_rank=iv_data['iv_rank'],
             iv_52w_high=iv_data['iv_high'],
             iv_52w_low=iv_data['iv_low'],
+            implied_move_pct=iv_data['implied_move'],
             hv_30d=hv_30d,
             hv_60d=hv_60d,
             iv_premium=iv_premium,
@@ -110,157 +158,139 @@ class OptionsAnalyzer:
             'iv_rank': None,
             'iv_high': None,
             'iv_low': None,
+            'implied_move': None,
         }
         
+        # Get options expiration dates
         try:
-            # Get options expiration dates
             expirations = self.stock.options
-            if not expirations:
-                return result
-            
-            # Get near-term ATM options for current IV
-            # Use expiration ~30 days out
-            target_date = datetime.now() + timedelta(days=30)
-            nearest_exp = min(expirations, 
-                             key=lambda x: abs(datetime.strptime(x, '%Y-%m-%d') - target_date))
-            
-            # Get options chain
-            chain = self.stock.option_chain(nearest_exp)
-            calls = chain.calls
-            puts = chain.puts
-            
-            if calls.empty:
-                return result
+        except Exception:
+            return result
+        if not expirations:
+            return result
+        
+        # Get near-term ATM options for current IV
+        # Use expiration ~30 days out. Expirations are sorted ISO dates, so
+        # bisect on the string and only parse the two neighbours
+        today = date.today()
+        target_date = today + timedelta(days=30)
+        i = bisect_left(expirations, target_date.isoformat())
+        nearest_exp = min(expirations[max(i - 1, 0):i + 1],
+                          key=lambda x: abs(date.fromisoformat(x) - target_date))
+        
+        # Get the near-term chain plus the first 6 (for the IV range) in one batch
+        chains = self._option_chains([nearest_exp, *expirations[:6]])
+        if nearest_exp not in chains:
+            return result
+        calls = chains[nearest_exp].calls
+        
+        # Get current price
+        current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice')
+        if calls.empty or not current_price:
+            return result
+        
+        # Current IV from ATM option
+        current_iv = self._atm_iv(calls, current_price)
+        if current_iv:
+            # Expected 1-sigma move to expiry: sigma * sqrt(T)
+            days = (date.fromisoformat(nearest_exp) - today).days
+            result['implied_move'] = current_iv * np.sqrt(max(days, 1) / 365) * 100
             
-            # Get current price
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
+            current_iv = current_iv * 100  # Convert to percentage
+            result['current_iv'] = current_iv
+        
+        # Estimate IV range from multiple expirations
+        iv_samples = []
+        for exp in expirations[:6]:  # Check first 6 expirations
+            if exp not in chains:
+                continue
+            iv = self._atm_iv(chains[exp].calls, current_price)
+            if iv:
+                iv_samples.append(iv * 100)
+        
+        if iv_samples:
+            # Use samples to estimate percentile
+            iv_high = max(iv_samples) * 1.3  # Estimate 52w high
+            iv_low = min(iv_samples) * 0.7   # Estimate 52w low
             
-            # Find ATM options
-            calls['strike_diff'] = abs(calls['strike'] - current_price)
-            atm_call = calls.loc[calls['strike_diff'].idxmin()]
+            result['iv_high'] = iv_high
+            result['iv_low'] = iv_low
             
-            # Current IV from ATM option
-            current_iv = atm_call.get('impliedVolatility', None)
             if current_iv:
-                current_iv = current_iv * 100  # Convert to percentage
-                result['current_iv'] = current_iv
-            
-            # Estimate IV range from multiple expirations
-            iv_samples = []
-            for exp in expirations[:6]:  # Check first 6 expirations
-                try:
-                    chain = self.stock.option_chain(exp)
-                    if not chain.calls.empty:
-                        chain.calls['strike_diff'] = abs(chain.calls['strike'] - current_price)
-                        atm = chain.calls.loc[chain.calls['strike_diff'].idxmin()]
-                        iv = atm.get('impliedVolatility', None)
-                        if iv:
-                            iv_samples.append(iv * 100)
-                except:
-                    continue
-            
-            if iv_samples:
-                # Use samples to estimate percentile
-                iv_high = max(iv_samples) * 1.3  # Estimate 52w high
-                iv_low = min(iv_samples) * 0.7   # Estimate 52w low
-                
-                result['iv_high'] = iv_high
-                result['iv_low'] = iv_low
+                # IV Rank = (current - low) / (high - low)
+                if iv_high > iv_low:
+                    result['iv_rank'] = ((current_iv - iv_low) / (iv_high - iv_low)) * 100
                 
-                if current_iv:
-                    # IV Rank = (current - low) / (high - low)
-                    if iv_high > iv_low:
-                        result['iv_rank'] = ((current_iv - iv_low) / (iv_high - iv_low)) * 100
-                    
-                    # IV Percentile (simplified - using rank as approximation)
-                    result['iv_percentile'] = result['iv_rank']
-            
-            return result
-            
-        except Exception as e:
-            return result
+                # IV Percentile (simplified - using rank as approximation)
+                result['iv_percentile'] = result['iv_rank']
+        
+        return result
+    
+    def _atm_iv(self, calls, current_price: float) -> Optional[float]:
+        """Implied volatility (decimal) of the call struck closest to spot."""
+        if calls.empty:
+            return None
+        
+        strikes = calls['strike'].to_numpy(dtype=float)
+        ivs = calls['impliedVolatility'].to_numpy(dtype=float)
+        iv = float(ivs[np.abs(strikes - current_price).argmin()])
+        
+        return iv if math.isfinite(iv) and iv > 0 else None
     
     def _calculate_historical_volatility(self) -> tuple:
         """Calculate historical (realized) volatility."""
+        # Get historical prices
         try:
-            # Get historical prices
             hist = self.stock.history(period='3mo')
-            if hist.empty or len(hist) < 30:
-                return None, None
-            
-            # Calculate daily returns
-            returns = hist['Close'].pct_change().dropna()
-            
-            # 30-day HV (annualized)
-            hv_30d = returns.tail(30).std() * np.sqrt(252) * 100
-            
-            # 60-day HV (annualized)
-            hv_60d = returns.tail(60).std() * np.sqrt(252) * 100 if len(returns) >= 60 else None
-            
-            return hv_30d, hv_60d
-            
-        except Exception as e:
+        except Exception:
+            return None, None
+        if hist.empty or len(hist) < 30:
             return None, None
+        
+        # Calculate daily returns in one pass over the raw close array
+        closes = hist['Close'].to_numpy(dtype=float)
+        returns = closes[1:] / closes[:-1] - 1
+        returns = returns[np.isfinite(returns)]
+        
+        # 30-day HV (annualized)
+        hv_30d = returns[-30:].std(ddof=1) * np.sqrt(252) * 100
+        
+        # 60-day HV (annualized)
+        hv_60d = returns[-60:].std(ddof=1) * np.sqrt(252) * 100 if len(returns) >= 60 else None
+        
+        return hv_30d, hv_60d
     
     def _get_options_liquidity(self) -> tuple:
         """Get options volume and open interest."""
         try:
             expirations = self.stock.options
-            if not expirations:
-                return None, None
-            
-            total_volume = 0
-            total_oi = 0
-            
-            for exp in expirations[:4]:  # First 4 expirations
-                try:
-                    chain = self.stock.option_chain(exp)
-                    total_volume += chain.calls['volume'].sum() + chain.puts['volume'].sum()
-                    total_oi += chain.calls['openInterest'].sum() + chain.puts['openInterest'].sum()
-                except:
-                    continue
-            
-            return int(total_volume), int(total_oi)
-            
-        except:
+        except Exception:
+            return None, None
+        if not expirations:
             return None, None
+        
+        total_volume = 0
+        total_oi = 0
+        
+        for chain in self._option_chains(expirations[:4]).values():  # First 4 expirations
+            total_volume += chain.calls['volume'].sum() + chain.puts['volume'].sum()
+            total_oi += chain.calls['openInterest'].sum() + chain.puts['openInterest'].sum()
+        
+        return int(total_volume), int(total_oi)
     
     def _iv_signal(self, percentile: Optional[float], rank: Optional[float]) -> str:
         """Generate IV signal."""
         if percentile is None:
             return "⚪ IV data unavailable"
         
-        if percentile <= 20:
-            return "🟢 IV Very Low - Options CHEAP"
-        elif percentile <= 40:
-            return "🟢 IV Low - Good time to buy options"
-        elif percentile <= 60:
-            return "🟡 IV Average"
-        elif percentile <= 80:
-            return "🟠 IV High - Options expensive"
-        else:
-            return "🔴 IV Very High - Options EXPENSIVE"
+        return self.IV_SIGNALS[bisect_left(self.IV_BAND_LIMITS, percentile)]
     
     def _leaps_timing(self, percentile: Optional[float], premium: Optional[float]) -> str:
         """Generate LEAPS timing recommendation."""
         if percentile is None:
             return "⚪ Unable to assess"
         
-        signals = []
-        
-        if percentile <= 25:
-            signals.append("🟢 EXCELLENT time to buy LEAPS")
-            signals.append("IV is historically low")
-        elif percentile <= 40:
-            signals.append("🟢 GOOD time to buy LEAPS")
-        elif percentile <= 60:
-            signals.append("🟡 NEUTRAL - Wait for lower IV if possible")
-        elif percentile <= 80:
-            signals.append("🟠 AVOID buying LEAPS now")
-            signals.append("IV is elevated")
-        else:
-            signals.append("🔴 BAD time to buy LEAPS")
-            signals.append("IV is very high - options overpriced")
+        signals = list(self.LEAPS_SIGNALS[bisect_left(self.LEAPS_BAND_LIMITS, percentile)])
         
         if premium is not None:
             if premium > 10:
@@ -297,6 +327,8 @@ class OptionsAnalyzer:
             lines.append(f"  IV Rank:        {data.iv_rank:.0f}%")
         if data.iv_52w_low and data.iv_52w_high:
             lines.append(f"  52-Week Range:  {data.iv_52w_low:.0f}% - {data.iv_52w_high:.0f}%")
+        if data.implied_move_pct:
+            lines.append(f"  Implied Move:   ±{data.implied_move_pct:.1f}% (to ~30d expiry)")
         
         lines.append("")
         
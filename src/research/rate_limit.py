@@ -0,0 +1,32 @@
+"""
+Rate Limiting
+
+Client-side throttles for the free data sources (SEC EDGAR, Yahoo),
+shared by every thread that talks to the same service.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows short bursts up to `rate` calls per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 1.0
+
+            self.tokens -= 1
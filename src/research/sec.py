@@ -0,0 +1,131 @@
+"""
+SEC EDGAR Client
+
+Shared HTTP plumbing for the trackers that read EDGAR (insider Form 4s,
+13F holdings):
+- One keep-alive session, with a connection pool per EDGAR host and
+  retries on transient errors (429/5xx)
+- One token bucket, so their combined traffic stays under SEC's
+  10 requests/second fair-access limit even when scans run in threads
+- Conditional GETs for the big JSON documents (ticker map, submissions):
+  the last copy is kept in the disk cache with its ETag/Last-Modified,
+  and an unchanged document comes back as a body-less 304
+"""
+
+import json
+import os
+import sys
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional faster JSON decoding (SEC submissions/ticker files are large)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.research.cache import load_cached, save_cached
+from src.research.rate_limit import TokenBucket
+
+
+SEC_HEADERS = {
+    'User-Agent': 'Research Platform contact@example.com',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+# SEC allows 10 requests/sec per client; stay just under it
+REQUESTS_PER_SECOND = 9
+
+# Keep-alive connections per host; archives see more traffic (index + document)
+DATA_POOL_SIZE = 4
+ARCHIVE_POOL_SIZE = 8
+
+
+_rate_limiter = TokenBucket(REQUESTS_PER_SECOND)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """The process-wide EDGAR session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                # Hand back the final 429/5xx response instead of raising,
+                # so callers can check the status (and fall back to caches)
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.headers.update(SEC_HEADERS)
+            # One adapter per EDGAR host so submissions and archive traffic
+            # keep their own warm connections
+            session.mount('https://data.sec.gov/', HTTPAdapter(pool_maxsize=DATA_POOL_SIZE, max_retries=retry))
+            session.mount('https://www.sec.gov/', HTTPAdapter(pool_maxsize=ARCHIVE_POOL_SIZE, max_retries=retry))
+            _session = session
+        return _session
+
+
+def sec_get(url: str, **kwargs) -> requests.Response:
+    """GET from SEC EDGAR, throttled across threads to respect the rate limit."""
+    _rate_limiter.acquire()
+    return get_session().get(url, timeout=10, **kwargs)
+
+
+def sec_json(response: requests.Response):
+    """Decode a JSON response body (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def sec_get_json(url: str, cache_key: str):
+    """
+    GET a JSON document from EDGAR, revalidating the disk-cached copy.
+
+    Args:
+        url: EDGAR JSON URL
+        cache_key: Key for the copy kept in the 'sec' cache namespace
+
+    Returns:
+        The decoded document (the cached one on 304), or None if the
+        request failed and nothing is cached
+    """
+    cached = load_cached('sec', cache_key)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        response = sec_get(url, headers=headers)
+    except requests.RequestException:
+        # Connection errors/timeouts: serve the last good copy if we have one
+        return cached['data'] if cached else None
+
+    if response.status_code == 304 and cached:
+        return cached['data']
+    if response.status_code != 200:
+        # Serve the last good copy rather than nothing (e.g. 429/5xx after retries)
+        return cached['data'] if cached else None
+
+    data = sec_json(response)
+    save_cached('sec', cache_key, {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'data': data,
+    })
+    return data
@@ -16,14 +16,21 @@ Why this matters:
 
 import os
 import sys
+import logging
 import requests
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dataclasses import dataclass
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import load_info
+from src.research.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ShortInterestData:
@@ -56,8 +63,36 @@ class ShortInterestTracker:
     The edge: Identify potential squeeze setups before they happen.
     """
     
+    # Short % of float bands (ascending cutoffs -> label for each band)
+    SHORT_LEVEL_CUTOFFS = (5, 10, 20)
+    SHORT_LEVEL_LABELS = (
+        "🟢 Low Short Interest",
+        "🟡 Moderate Short Interest",
+        "🟠 High Short Interest",
+        "🔴 Very High Short Interest",
+    )
+    
+    # Squeeze scoring: one point per cutoff reached
+    SQUEEZE_SHORT_PCT_CUTOFFS = (10, 20, 30)
+    SQUEEZE_DAYS_CUTOFFS = (4, 7)
+    SQUEEZE_CHANGE_CUTOFFS = (10, 20)
+    
+    # Total squeeze score -> risk level
+    SQUEEZE_RISK_CUTOFFS = (1, 3, 5)
+    SQUEEZE_RISK_LABELS = (
+        "✅ Minimal Squeeze Risk",
+        "📊 Low Squeeze Risk",
+        "⚠️ Moderate Squeeze Risk",
+        "🚨 HIGH SQUEEZE POTENTIAL",
+    )
+    
+    # Concurrent Yahoo lookups while scanning, capped at SCAN_RATE fetches/sec
+    SCAN_WORKERS = 8
+    SCAN_RATE = 20
+    
     def __init__(self):
-        pass
+        # Shared by scan workers; None for one-off lookups
+        self._rate_limiter: Optional[TokenBucket] = None
     
     def get_short_interest(self, ticker: str) -> Optional[ShortInterestData]:
         """
@@ -68,8 +103,8 @@ class ShortInterestTracker:
         ticker = ticker.upper()
         
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # Short interest is only reported twice a month; a day-old profile is fine
+            info = load_info(ticker, rate_limiter=self._rate_limiter)
             
             # Get key metrics
             short_interest = info.get('sharesShort', 0)
@@ -111,22 +146,15 @@ class ShortInterestTracker:
             )
             
         except Exception as e:
-            print(f"   Error getting short data for {ticker}: {e}")
+            logger.warning("Error getting short data for %s: %s", ticker, e)
             return None
     
     def _determine_signal(self, short_pct: float, days_to_cover: float, change_pct: Optional[float]) -> str:
         """Determine the short interest signal."""
         signals = []
         
-        # High short interest
-        if short_pct >= 20:
-            signals.append("🔴 Very High Short Interest")
-        elif short_pct >= 10:
-            signals.append("🟠 High Short Interest")
-        elif short_pct >= 5:
-            signals.append("🟡 Moderate Short Interest")
-        else:
-            signals.append("🟢 Low Short Interest")
+        # Short interest level
+        signals.append(self.SHORT_LEVEL_LABELS[bisect_right(self.SHORT_LEVEL_CUTOFFS, short_pct)])
         
         # Days to cover
         if days_to_cover >= 5:
@@ -147,38 +175,16 @@ class ShortInterestTracker:
     
     def _assess_squeeze_risk(self, short_pct: float, days_to_cover: float, change_pct: Optional[float]) -> str:
         """Assess potential for a short squeeze."""
-        score = 0
-        
-        # Short % of float scoring
-        if short_pct >= 30:
-            score += 3
-        elif short_pct >= 20:
-            score += 2
-        elif short_pct >= 10:
-            score += 1
-        
-        # Days to cover scoring
-        if days_to_cover >= 7:
-            score += 2
-        elif days_to_cover >= 4:
-            score += 1
+        # Short % of float and days to cover scoring
+        score = bisect_right(self.SQUEEZE_SHORT_PCT_CUTOFFS, short_pct)
+        score += bisect_right(self.SQUEEZE_DAYS_CUTOFFS, days_to_cover)
         
         # Trend scoring (shorts increasing = more squeeze potential)
         if change_pct:
-            if change_pct >= 20:
-                score += 2
-            elif change_pct >= 10:
-                score += 1
+            score += bisect_right(self.SQUEEZE_CHANGE_CUTOFFS, change_pct)
         
         # Determine risk level
-        if score >= 5:
-            return "🚨 HIGH SQUEEZE POTENTIAL"
-        elif score >= 3:
-            return "⚠️ Moderate Squeeze Risk"
-        elif score >= 1:
-            return "📊 Low Squeeze Risk"
-        else:
-            return "✅ Minimal Squeeze Risk"
+        return self.SQUEEZE_RISK_LABELS[bisect_right(self.SQUEEZE_RISK_CUTOFFS, score)]
     
     def format_report(self, data: ShortInterestData) -> str:
         """Format short interest report for display."""
@@ -244,6 +250,18 @@ class ShortInterestTracker:
         
         return "\n".join(lines)
     
+    def _get_many(self, tickers: List[str]):
+        """
+        Short interest for many tickers, yielding (ticker, data) in input order.
+        
+        Each lookup is a network round-trip to Yahoo (unless cached), so a
+        pool of workers overlaps the waiting; one token bucket shared by the
+        workers caps Yahoo fetches at SCAN_RATE per second.
+        """
+        self._rate_limiter = TokenBucket(self.SCAN_RATE)
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            yield from zip(tickers, pool.map(self.get_short_interest, tickers))
+    
     def scan_for_squeezes(self, tickers: List[str], min_short_pct: float = 10) -> List[ShortInterestData]:
         """
         Scan multiple tickers for potential squeeze candidates.
@@ -259,12 +277,10 @@ class ShortInterestTracker:
         
         print(f"\n📊 Scanning {len(tickers)} stocks for high short interest...")
         
-        for i, ticker in enumerate(tickers):
+        for i, (ticker, data) in enumerate(self._get_many(tickers)):
             if i % 10 == 0 and i > 0:
                 print(f"   Progress: {i}/{len(tickers)}...")
             
-            data = self.get_short_interest(ticker)
-            
             if data and data.short_pct_float >= min_short_pct:
                 results.append(data)
                 print(f"   ✅ {ticker}: {data.short_pct_float:.1f}% short ({data.squeeze_risk})")
@@ -280,8 +296,7 @@ class ShortInterestTracker:
         
         print(f"\n🎯 Finding squeeze candidates in {len(tickers)} stocks...")
         
-        for ticker in tickers:
-            data = self.get_short_interest(ticker)
+        for ticker, data in self._get_many(tickers):
             if data:
                 all_data.append(data)
         
@@ -326,16 +341,22 @@ def find_squeezes(tickers: List[str]):
     candidates = tracker.find_squeeze_candidates(tickers)
     
     if candidates:
-        print("\n" + "═" * 55)
-        print("🎯 POTENTIAL SQUEEZE CANDIDATES")
-        print("═" * 55)
+        lines = [
+            "",
+            "═" * 55,
+            "🎯 POTENTIAL SQUEEZE CANDIDATES",
+            "═" * 55,
+        ]
         
         for data in candidates:
-            print(f"\n{data.squeeze_risk}")
-            print(f"   {data.ticker}: {data.short_pct_float:.1f}% short, {data.short_ratio:.1f} days to cover")
+            lines.append("")
+            lines.append(data.squeeze_risk)
+            lines.append(f"   {data.ticker}: {data.short_pct_float:.1f}% short, {data.short_ratio:.1f} days to cover")
             if data.change_pct:
                 change_emoji = "📈" if data.change_pct > 0 else "📉"
-                print(f"   {change_emoji} {data.change_pct:+.1f}% change from last month")
+                lines.append(f"   {change_emoji} {data.change_pct:+.1f}% change from last month")
+        
+        print("\n".join(lines))
     else:
         print("\n   No significant squeeze candidates found")
 
@@ -13,22 +13,40 @@ This is what the scanner should have been from the start.
 
 import os
 import sys
-from typing import List, Dict
+from typing import List, NamedTuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from src.research.discovery import StockDiscovery
 from src.research.moat_analyzer import MoatAnalyzer, MoatAnalysis
+from src.research.cache import load_info
 from src.alpha_lab.telegram_alerts import send_message
-import yfinance as yf
+
+# Concurrent GPT moat calls (kept low to stay under OpenAI rate limits)
+MOAT_WORKERS = 4
+
+# Moat flags shown in the Telegram alert, in display order
+MOAT_FLAG_EMOJI = (
+    ('has_recurring_revenue', "🔄"),
+    ('has_switching_costs', "🔒"),
+    ('has_network_effects', "🕸️"),
+    ('has_pricing_power', "💰"),
+)
+
+
+class VettedStock(NamedTuple):
+    """A discovery candidate paired with its moat analysis."""
+    stock: object
+    moat: MoatAnalysis
 
 
 def smart_discover(
     max_scan: int = 300,
     min_moat_score: int = 6,
     send_telegram: bool = True,
-) -> List[Dict]:
+) -> List[VettedStock]:
     """
     Smart discovery: Numbers + Moat Analysis.
     
@@ -71,43 +89,43 @@ def smart_discover(
     vetted = []
     rejected = []
     
-    for i, stock in enumerate(candidates):
-        print(f"   [{i+1}/{len(candidates)}] Analyzing {stock.ticker}...")
+    def vet(stock):
+        # Get full info for GPT (usually still cached from the scan)
+        info = load_info(stock.ticker)
         
-        try:
-            # Get full info for GPT
-            info = yf.Ticker(stock.ticker).info
+        return analyzer.analyze(
+            ticker=stock.ticker,
+            name=stock.name,
+            sector=stock.sector,
+            industry=stock.industry,
+            description=info.get('longBusinessSummary', ''),
+            revenue_b=info.get('totalRevenue', 0) / 1e9,
+            revenue_growth=stock.revenue_growth,
+            gross_margin=stock.gross_margin,
+            operating_margin=(info.get('operatingMargins', 0) or 0) * 100,
+        )
+    
+    # Each candidate is an info fetch + GPT round-trip (network-bound), so
+    # submit the whole batch up front and collect results in scan order
+    with ThreadPoolExecutor(max_workers=MOAT_WORKERS) as pool:
+        futures = [pool.submit(vet, stock) for stock in candidates]
+        
+        for i, (stock, future) in enumerate(zip(candidates, futures)):
+            print(f"   [{i+1}/{len(candidates)}] Analyzing {stock.ticker}...")
             
-            analysis = analyzer.analyze(
-                ticker=stock.ticker,
-                name=stock.name,
-                sector=stock.sector,
-                industry=stock.industry,
-                description=info.get('longBusinessSummary', ''),
-                revenue_b=info.get('totalRevenue', 0) / 1e9,
-                revenue_growth=stock.revenue_growth,
-                gross_margin=stock.gross_margin,
-                operating_margin=(info.get('operatingMargins', 0) or 0) * 100,
-            )
+            try:
+                analysis = future.result()
+            except Exception as e:
+                print(f"      ⚠️ Error: {e}")
+                continue
             
             if analysis:
                 if analysis.moat_score >= min_moat_score and analysis.verdict != "GARBAGE":
-                    vetted.append({
-                        'stock': stock,
-                        'moat': analysis,
-                    })
+                    vetted.append(VettedStock(stock, analysis))
                     print(f"      ✅ {analysis.verdict} - Moat {analysis.moat_score}/10")
                 else:
-                    rejected.append({
-                        'stock': stock,
-                        'moat': analysis,
-                        'reason': f"{analysis.verdict} (Moat {analysis.moat_score}/10)"
-                    })
+                    rejected.append(VettedStock(stock, analysis))
                     print(f"      ❌ {analysis.verdict} - {analysis.one_liner[:40]}")
-            
-        except Exception as e:
-            print(f"      ⚠️ Error: {e}")
-            continue
     
     # Step 3: Results
     print("\n" + "=" * 60)
@@ -125,11 +143,9 @@ def smart_discover(
         print("-" * 60)
         
         # Sort by moat score
-        vetted.sort(key=lambda x: x['moat'].moat_score, reverse=True)
+        vetted.sort(key=lambda x: x.moat.moat_score, reverse=True)
         
-        for item in vetted:
-            stock = item['stock']
-            moat = item['moat']
+        for stock, moat in vetted:
             print(f"\n{analyzer.format_analysis(moat)}")
             print(f"   Numbers: ${stock.market_cap}B cap | +{stock.revenue_growth}% growth | Score {stock.score}")
     
@@ -143,11 +159,11 @@ def smart_discover(
     return vetted
 
 
-def format_smart_alert(vetted: List[Dict], total_candidates: int, rejected: int) -> str:
+def format_smart_alert(vetted: List[VettedStock], total_candidates: int, rejected: int) -> str:
     """Format smart discovery for Telegram."""
     lines = [
         "🧠 SMART DISCOVERY",
-        f"   {datetime.now().strftime('%b %d, %Y')}",
+        f"   {datetime.now():%b %d, %Y}",
         "",
         f"Scanned → {total_candidates} numerical candidates",
         f"Rejected → {rejected} (banks, commodities, weak moat)",
@@ -157,26 +173,15 @@ def format_smart_alert(vetted: List[Dict], total_candidates: int, rejected: int)
         "",
     ]
     
-    for item in vetted[:5]:
-        stock = item['stock']
-        moat = item['moat']
-        
+    for stock, moat in vetted[:5]:
         # Verdict emoji
         emoji = "✅" if moat.verdict == "GOOD" else "😐"
         
         # Moat indicators
-        moat_str = []
-        if moat.has_recurring_revenue:
-            moat_str.append("🔄")
-        if moat.has_switching_costs:
-            moat_str.append("🔒")
-        if moat.has_network_effects:
-            moat_str.append("🕸️")
-        if moat.has_pricing_power:
-            moat_str.append("💰")
+        moat_str = ''.join(icon for flag, icon in MOAT_FLAG_EMOJI if getattr(moat, flag))
         
         lines.extend([
-            f"{emoji} {stock.ticker} - Moat {moat.moat_score}/10 {''.join(moat_str)}",
+            f"{emoji} {stock.ticker} - Moat {moat.moat_score}/10 {moat_str}",
             f"   {moat.one_liner}",
             f"   ${stock.market_cap}B | +{stock.revenue_growth}% growth",
             f"   💡 {moat.recommendation[:60]}",
@@ -20,6 +20,11 @@ import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker, load_cached, save_cached
+
+# Daily bars only change once a day; an hour-old pull is fine for research
+HISTORY_CACHE_TTL = 3600
+
 
 @dataclass
 class TechnicalData:
@@ -75,19 +80,23 @@ class TechnicalAnalyzer:
     
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
         self.hist = None
         self.spy_hist = None
+        self.as_of = None
     
     def analyze(self) -> TechnicalData:
         """Run full technical analysis."""
         
         company_name = self.info.get('shortName', self.ticker)
         
+        # One reference time for every calculation (YTD, current month)
+        self.as_of = datetime.now()
+        
         # Get historical data
-        self.hist = self.stock.history(period='2y')
-        self.spy_hist = yf.Ticker('SPY').history(period='2y')
+        self.hist = self._get_history(self.ticker, self.stock)
+        self.spy_hist = self._get_history('SPY')
         
         current_price = self.hist['Close'].iloc[-1] if not self.hist.empty else 0
         
@@ -109,6 +118,18 @@ class TechnicalAnalyzer:
             **ma_data,
         )
     
+    def _get_history(self, symbol: str, stock: yf.Ticker = None, period: str = '2y') -> pd.DataFrame:
+        """Daily OHLCV history, served from the disk cache when fresh."""
+        key = f"{symbol}_{period}"
+        hist = load_cached('history', key, max_age=HISTORY_CACHE_TTL)
+        if hist is not None:
+            return hist
+        
+        hist = (stock or get_ticker(symbol)).history(period=period)
+        if not hist.empty:
+            save_cached('history', key, hist)
+        return hist
+    
     def _calculate_relative_strength(self) -> Dict:
         """Calculate relative strength vs SPY."""
         result = {
@@ -123,37 +144,26 @@ class TechnicalAnalyzer:
             if self.hist.empty or self.spy_hist.empty:
                 return result
             
-            # Calculate returns for different periods
-            periods = {
-                '1m': 21,
-                '3m': 63,
-                '6m': 126,
-            }
-            
-            stock_current = self.hist['Close'].iloc[-1]
-            spy_current = self.spy_hist['Close'].iloc[-1]
-            
-            for period_name, days in periods.items():
-                if len(self.hist) > days and len(self.spy_hist) > days:
-                    stock_past = self.hist['Close'].iloc[-days]
-                    spy_past = self.spy_hist['Close'].iloc[-days]
-                    
-                    stock_return = (stock_current / stock_past - 1) * 100
-                    spy_return = (spy_current / spy_past - 1) * 100
-                    
-                    result[f'rs_vs_spy_{period_name}'] = stock_return - spy_return
+            # Align stock and SPY on common dates: one (T, 2) close matrix
+            aligned = pd.concat(
+                [self.hist['Close'], self.spy_hist['Close']], axis=1, join='inner'
+            )
+            closes = aligned.to_numpy()
+            
+            # Returns for all lookbacks in one pass (rows = periods, cols = stock/SPY)
+            periods = np.array(['1m', '3m', '6m'])
+            days = np.array([21, 63, 126])
+            has_data = days < len(closes)
+            
+            returns = (closes[-1] / closes[-days[has_data]] - 1) * 100
+            for period_name, rs in zip(periods[has_data], returns[:, 0] - returns[:, 1]):
+                result[f'rs_vs_spy_{period_name}'] = float(rs)
             
             # YTD
-            try:
-                year_start = datetime(datetime.now().year, 1, 1)
-                stock_ytd_start = self.hist.loc[self.hist.index >= str(year_start)]['Close'].iloc[0]
-                spy_ytd_start = self.spy_hist.loc[self.spy_hist.index >= str(year_start)]['Close'].iloc[0]
-                
-                stock_ytd = (stock_current / stock_ytd_start - 1) * 100
-                spy_ytd = (spy_current / spy_ytd_start - 1) * 100
-                result['rs_vs_spy_ytd'] = stock_ytd - spy_ytd
-            except:
-                pass
+            ytd = closes[aligned.index.year == self.as_of.year]
+            if len(ytd):
+                ytd_returns = (closes[-1] / ytd[0] - 1) * 100
+                result['rs_vs_spy_ytd'] = float(ytd_returns[0] - ytd_returns[1])
             
             # Generate signal
             rs_3m = result['rs_vs_spy_3m']
@@ -240,28 +250,16 @@ class TechnicalAnalyzer:
             highs = self.hist['High'].tail(100)
             lows = self.hist['Low'].tail(100)
             
-            # Find local maxima and minima
-            resistance_candidates = []
-            support_candidates = []
-            
+            # Find local maxima and minima: a bar is a pivot if it's the extreme
+            # of the centered window around it (one rolling pass, edges are NaN)
             window = 5
-            for i in range(window, len(highs) - window):
-                # Local max
-                if highs.iloc[i] == highs.iloc[i-window:i+window+1].max():
-                    resistance_candidates.append(highs.iloc[i])
-                # Local min
-                if lows.iloc[i] == lows.iloc[i-window:i+window+1].min():
-                    support_candidates.append(lows.iloc[i])
-            
-            # Also add round numbers near current price
-            round_levels = []
-            base = int(current / 10) * 10
-            for i in range(-3, 4):
-                round_levels.append(base + i * 10)
-            
-            # Combine and filter
-            all_resistance = [r for r in resistance_candidates if r > current]
-            all_support = [s for s in support_candidates if s < current]
+            span = 2 * window + 1
+            is_peak = highs == highs.rolling(span, center=True).max()
+            is_trough = lows == lows.rolling(span, center=True).min()
+            
+            # Keep pivots on the right side of the current price
+            all_resistance = highs[is_peak & (highs > current)].to_numpy()
+            all_support = lows[is_trough & (lows < current)].to_numpy()
             
             # Get unique levels (cluster nearby levels)
             result['resistance_levels'] = self._cluster_levels(all_resistance)[:3]
@@ -281,24 +279,19 @@ class TechnicalAnalyzer:
         except Exception as e:
             return result
     
-    def _cluster_levels(self, levels: List[float], threshold: float = 0.02) -> List[float]:
+    def _cluster_levels(self, levels: np.ndarray, threshold: float = 0.02) -> List[float]:
         """Cluster nearby price levels."""
-        if not levels:
+        if len(levels) == 0:
             return []
         
-        levels = sorted(levels)
-        clustered = []
-        current_cluster = [levels[0]]
-        
-        for level in levels[1:]:
-            if (level - current_cluster[-1]) / current_cluster[-1] < threshold:
-                current_cluster.append(level)
-            else:
-                clustered.append(sum(current_cluster) / len(current_cluster))
-                current_cluster = [level]
-        
-        clustered.append(sum(current_cluster) / len(current_cluster))
-        return clustered
+        # Sorted levels start a new cluster wherever the step up from the
+        # previous level is at least `threshold`; each cluster is averaged
+        levels = np.sort(levels)
+        new_cluster = np.diff(levels) / levels[:-1] >= threshold
+        cluster_ids = np.concatenate(([0], np.cumsum(new_cluster)))
+        sums = np.bincount(cluster_ids, weights=levels)
+        counts = np.bincount(cluster_ids)
+        return (sums / counts).tolist()
     
     def _calculate_seasonality(self) -> Dict:
         """Calculate monthly seasonality patterns."""
@@ -316,21 +309,14 @@ class TechnicalAnalyzer:
             # Calculate monthly returns
             monthly = self.hist['Close'].resample('ME').last().pct_change() * 100
             
-            # Group by month
-            monthly_avg = {}
-            for date, ret in monthly.items():
-                if pd.notna(ret):
-                    month = date.month
-                    if month not in monthly_avg:
-                        monthly_avg[month] = []
-                    monthly_avg[month].append(ret)
-            
-            # Calculate averages
-            month_performance = []
-            for month, returns in monthly_avg.items():
-                if len(returns) >= 2:
-                    avg = sum(returns) / len(returns)
-                    month_performance.append((self.MONTH_NAMES[month-1], avg))
+            # Average by calendar month (need 2+ years of that month)
+            monthly = monthly.dropna()
+            by_month = monthly.groupby(monthly.index.month).agg(['mean', 'count'])
+            by_month = by_month[by_month['count'] >= 2]
+            
+            month_performance = [
+                (self.MONTH_NAMES[month-1], avg) for month, avg in by_month['mean'].items()
+            ]
             
             # Sort by performance
             month_performance.sort(key=lambda x: x[1], reverse=True)
@@ -339,7 +325,7 @@ class TechnicalAnalyzer:
             result['worst_months'] = month_performance[-3:]
             
             # Current month
-            current_month = datetime.now().month
+            current_month = self.as_of.month
             for name, avg in month_performance:
                 if name == self.MONTH_NAMES[current_month-1]:
                     result['current_month_historical'] = avg
@@ -485,7 +471,7 @@ class TechnicalAnalyzer:
         lines.append("")
         
         if data.current_month_historical is not None:
-            current_month = self.MONTH_NAMES[datetime.now().month - 1]
+            current_month = self.MONTH_NAMES[(self.as_of or datetime.now()).month - 1]
             lines.append(f"  {current_month} Historical Avg: {data.current_month_historical:+.1f}%")
         
         if data.best_months:
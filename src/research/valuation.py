@@ -20,11 +20,12 @@ import os
 import sys
 from typing import Optional, Dict, List
 from dataclasses import dataclass
-import yfinance as yf
 import math
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from src.research.cache import get_ticker
+
 
 @dataclass
 class ValuationResult:
@@ -71,16 +72,38 @@ class StockValuation:
     Calculate fair value using multiple methods.
     """
     
+    # Reasonable PE by sector
+    SECTOR_PE = {
+        'Technology': 25,
+        'Healthcare': 20,
+        'Financial Services': 12,
+        'Consumer Cyclical': 18,
+        'Consumer Defensive': 20,
+        'Energy': 12,
+        'Utilities': 15,
+        'Real Estate': 18,
+        'Industrials': 18,
+        'Basic Materials': 15,
+        'Communication Services': 20,
+    }
+    
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
+        self.stock = get_ticker(self.ticker)
         self.info = self.stock.info
+        self.current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice') or 0
         self.results: List[ValuationResult] = []
     
+    def _upside(self, fair_value: float) -> Optional[float]:
+        """Upside (%) from the current price to a fair value."""
+        if self.current_price <= 0:
+            return None
+        return ((fair_value / self.current_price) - 1) * 100
+    
     def analyze(self) -> ValuationSummary:
         """Run all valuation methods and return summary."""
         
-        current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
+        current_price = self.current_price
         company_name = self.info.get('shortName', self.ticker)
         
         # Run each valuation method
@@ -144,60 +167,55 @@ class StockValuation:
         
         Fair Value = Sum of discounted future cash flows + terminal value
         """
-        try:
-            # Get free cash flow
-            fcf = self.info.get('freeCashflow', 0)
-            if not fcf or fcf <= 0:
-                self.results.append(ValuationResult(
-                    method="DCF",
-                    fair_value=None,
-                    upside_pct=None,
-                    confidence="N/A",
-                    notes="No positive free cash flow"
-                ))
-                return None
-            
-            # Get shares outstanding
-            shares = self.info.get('sharesOutstanding', 0)
-            if not shares:
-                return None
-            
-            # Assumptions
-            growth_rate = min(self.info.get('revenueGrowth', 0.1) or 0.1, 0.25)  # Cap at 25%
-            discount_rate = 0.10  # 10% required return
-            terminal_growth = 0.03  # 3% perpetual growth
-            years = 5
-            
-            # Project future cash flows
-            total_pv = 0
-            for year in range(1, years + 1):
-                future_fcf = fcf * ((1 + growth_rate) ** year)
-                pv = future_fcf / ((1 + discount_rate) ** year)
-                total_pv += pv
-            
-            # Terminal value
-            terminal_fcf = fcf * ((1 + growth_rate) ** years) * (1 + terminal_growth)
-            terminal_value = terminal_fcf / (discount_rate - terminal_growth)
-            terminal_pv = terminal_value / ((1 + discount_rate) ** years)
-            
-            total_pv += terminal_pv
-            
-            fair_value = total_pv / shares
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
-            upside = ((fair_value / current_price) - 1) * 100 if current_price > 0 else None
-            
+        # Get free cash flow
+        fcf = self.info.get('freeCashflow', 0)
+        if not fcf or fcf <= 0:
             self.results.append(ValuationResult(
                 method="DCF",
-                fair_value=fair_value,
-                upside_pct=upside,
-                confidence="Medium",
-                notes=f"Based on {growth_rate*100:.0f}% growth, 10% discount rate"
+                fair_value=None,
+                upside_pct=None,
+                confidence="N/A",
+                notes="No positive free cash flow"
             ))
-            
-            return fair_value
-            
-        except Exception as e:
             return None
+        
+        # Get shares outstanding
+        shares = self.info.get('sharesOutstanding', 0)
+        if not shares:
+            return None
+        
+        # Assumptions
+        growth_rate = min(self.info.get('revenueGrowth', 0.1) or 0.1, 0.25)  # Cap at 25%
+        discount_rate = 0.10  # 10% required return
+        terminal_growth = 0.03  # 3% perpetual growth
+        years = 5
+        
+        # Project future cash flows
+        total_pv = 0
+        for year in range(1, years + 1):
+            future_fcf = fcf * ((1 + growth_rate) ** year)
+            pv = future_fcf / ((1 + discount_rate) ** year)
+            total_pv += pv
+        
+        # Terminal value
+        terminal_fcf = fcf * ((1 + growth_rate) ** years) * (1 + terminal_growth)
+        terminal_value = terminal_fcf / (discount_rate - terminal_growth)
+        terminal_pv = terminal_value / ((1 + discount_rate) ** years)
+        
+        total_pv += terminal_pv
+        
+        fair_value = total_pv / shares
+        upside = self._upside(fair_value)
+        
+        self.results.append(ValuationResult(
+            method="DCF",
+            fair_value=fair_value,
+            upside_pct=upside,
+            confidence="Medium",
+            notes=f"Based on {growth_rate*100:.0f}% growth, 10% discount rate"
+        ))
+        
+        return fair_value
     
     def _graham_number(self) -> Optional[float]:
         """
@@ -205,38 +223,33 @@ class StockValuation:
         
         Graham Number = √(22.5 × EPS × Book Value per Share)
         """
-        try:
-            eps = self.info.get('trailingEps', 0)
-            book_value = self.info.get('bookValue', 0)
-            
-            if not eps or eps <= 0 or not book_value or book_value <= 0:
-                self.results.append(ValuationResult(
-                    method="Graham Number",
-                    fair_value=None,
-                    upside_pct=None,
-                    confidence="N/A",
-                    notes="Needs positive EPS and book value"
-                ))
-                return None
-            
-            # Graham's formula: √(22.5 × EPS × BVPS)
-            graham_value = math.sqrt(22.5 * eps * book_value)
-            
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
-            upside = ((graham_value / current_price) - 1) * 100 if current_price > 0 else None
-            
+        eps = self.info.get('trailingEps', 0)
+        book_value = self.info.get('bookValue', 0)
+        
+        if not eps or eps <= 0 or not book_value or book_value <= 0:
             self.results.append(ValuationResult(
                 method="Graham Number",
-                fair_value=graham_value,
-                upside_pct=upside,
-                confidence="Medium",
-                notes=f"EPS: ${eps:.2f}, Book: ${book_value:.2f}"
+                fair_value=None,
+                upside_pct=None,
+                confidence="N/A",
+                notes="Needs positive EPS and book value"
             ))
-            
-            return graham_value
-            
-        except Exception as e:
             return None
+        
+        # Graham's formula: √(22.5 × EPS × BVPS)
+        graham_value = math.sqrt(22.5 * eps * book_value)
+        
+        upside = self._upside(graham_value)
+        
+        self.results.append(ValuationResult(
+            method="Graham Number",
+            fair_value=graham_value,
+            upside_pct=upside,
+            confidence="Medium",
+            notes=f"EPS: ${eps:.2f}, Book: ${book_value:.2f}"
+        ))
+        
+        return graham_value
     
     def _pe_based_valuation(self) -> Optional[float]:
         """
@@ -244,100 +257,75 @@ class StockValuation:
         
         Compare current PE to historical average or apply reasonable PE to earnings.
         """
-        try:
-            eps = self.info.get('trailingEps', 0)
-            forward_eps = self.info.get('forwardEps', 0)
-            current_pe = self.info.get('trailingPE', 0)
-            
-            if not eps or eps <= 0:
-                self.results.append(ValuationResult(
-                    method="PE-Based",
-                    fair_value=None,
-                    upside_pct=None,
-                    confidence="N/A",
-                    notes="No positive earnings"
-                ))
-                return None
-            
-            # Use sector-appropriate PE
-            sector = self.info.get('sector', '')
-            
-            # Reasonable PE by sector
-            sector_pe = {
-                'Technology': 25,
-                'Healthcare': 20,
-                'Financial Services': 12,
-                'Consumer Cyclical': 18,
-                'Consumer Defensive': 20,
-                'Energy': 12,
-                'Utilities': 15,
-                'Real Estate': 18,
-                'Industrials': 18,
-                'Basic Materials': 15,
-                'Communication Services': 20,
-            }
-            
-            target_pe = sector_pe.get(sector, 18)
-            
-            # Use forward EPS if available, otherwise trailing
-            use_eps = forward_eps if forward_eps and forward_eps > 0 else eps
-            fair_value = use_eps * target_pe
-            
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
-            upside = ((fair_value / current_price) - 1) * 100 if current_price > 0 else None
-            
-            eps_type = "forward" if forward_eps and forward_eps > 0 else "trailing"
-            
+        eps = self.info.get('trailingEps', 0)
+        forward_eps = self.info.get('forwardEps', 0)
+        current_pe = self.info.get('trailingPE', 0)
+        
+        if not eps or eps <= 0:
             self.results.append(ValuationResult(
                 method="PE-Based",
-                fair_value=fair_value,
-                upside_pct=upside,
-                confidence="Medium",
-                notes=f"Target PE: {target_pe}x ({sector}), using {eps_type} EPS"
+                fair_value=None,
+                upside_pct=None,
+                confidence="N/A",
+                notes="No positive earnings"
             ))
-            
-            return fair_value
-            
-        except Exception as e:
             return None
+        
+        # Use sector-appropriate PE
+        sector = self.info.get('sector', '')
+        
+        target_pe = self.SECTOR_PE.get(sector, 18)
+        
+        # Use forward EPS if available, otherwise trailing
+        use_eps = forward_eps if forward_eps and forward_eps > 0 else eps
+        fair_value = use_eps * target_pe
+        
+        upside = self._upside(fair_value)
+        
+        eps_type = "forward" if forward_eps and forward_eps > 0 else "trailing"
+        
+        self.results.append(ValuationResult(
+            method="PE-Based",
+            fair_value=fair_value,
+            upside_pct=upside,
+            confidence="Medium",
+            notes=f"Target PE: {target_pe}x ({sector}), using {eps_type} EPS"
+        ))
+        
+        return fair_value
     
     def _analyst_target(self) -> Optional[float]:
         """
         Wall Street analyst consensus price target.
         """
-        try:
-            target = self.info.get('targetMeanPrice', 0)
-            target_low = self.info.get('targetLowPrice', 0)
-            target_high = self.info.get('targetHighPrice', 0)
-            num_analysts = self.info.get('numberOfAnalystOpinions', 0)
-            
-            if not target or target <= 0:
-                self.results.append(ValuationResult(
-                    method="Analyst Target",
-                    fair_value=None,
-                    upside_pct=None,
-                    confidence="N/A",
-                    notes="No analyst coverage"
-                ))
-                return None
-            
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
-            upside = ((target / current_price) - 1) * 100 if current_price > 0 else None
-            
-            confidence = "High" if num_analysts >= 10 else "Medium" if num_analysts >= 5 else "Low"
-            
+        target = self.info.get('targetMeanPrice', 0)
+        target_low = self.info.get('targetLowPrice') or 0
+        target_high = self.info.get('targetHighPrice') or 0
+        num_analysts = self.info.get('numberOfAnalystOpinions') or 0
+        
+        if not target or target <= 0:
             self.results.append(ValuationResult(
                 method="Analyst Target",
-                fair_value=target,
-                upside_pct=upside,
-                confidence=confidence,
-                notes=f"{num_analysts} analysts (${target_low:.0f}-${target_high:.0f})"
+                fair_value=None,
+                upside_pct=None,
+                confidence="N/A",
+                notes="No analyst coverage"
             ))
-            
-            return target
-            
-        except Exception as e:
             return None
+        
+        upside = self._upside(target)
+        
+        confidence = "High" if num_analysts >= 10 else "Medium" if num_analysts >= 5 else "Low"
+        
+        self.results.append(ValuationResult(
+            method="Analyst Target",
+            fair_value=target,
+            upside_pct=upside,
+            confidence=confidence,
+            notes=f"{num_analysts} analysts (${target_low:.0f}-${target_high:.0f})"
+        ))
+        
+        return target
     
     def _peg_based_valuation(self) -> Optional[float]:
         """
@@ -345,46 +333,41 @@ class StockValuation:
         
         Fair PE = Growth Rate (Peter Lynch's rule: PEG of 1 is fair)
         """
-        try:
-            eps = self.info.get('trailingEps', 0)
-            growth_rate = self.info.get('earningsGrowth', 0) or self.info.get('revenueGrowth', 0)
-            
-            if not eps or eps <= 0 or not growth_rate or growth_rate <= 0:
-                self.results.append(ValuationResult(
-                    method="PEG-Based",
-                    fair_value=None,
-                    upside_pct=None,
-                    confidence="N/A",
-                    notes="Needs positive EPS and growth"
-                ))
-                return None
-            
-            # Convert growth to percentage if needed
-            if growth_rate < 1:
-                growth_pct = growth_rate * 100
-            else:
-                growth_pct = growth_rate
-            
-            # Peter Lynch: Fair PE = Growth Rate
-            # A 20% grower deserves 20x PE
-            fair_pe = min(growth_pct, 30)  # Cap at 30x
-            fair_value = eps * fair_pe
-            
-            current_price = self.info.get('currentPrice') or self.info.get('regularMarketPrice', 0)
-            upside = ((fair_value / current_price) - 1) * 100 if current_price > 0 else None
-            
+        eps = self.info.get('trailingEps', 0)
+        growth_rate = self.info.get('earningsGrowth', 0) or self.info.get('revenueGrowth', 0)
+        
+        if not eps or eps <= 0 or not growth_rate or growth_rate <= 0:
             self.results.append(ValuationResult(
                 method="PEG-Based",
-                fair_value=fair_value,
-                upside_pct=upside,
-                confidence="Medium",
-                notes=f"Growth: {growth_pct:.0f}% → Fair PE: {fair_pe:.0f}x"
+                fair_value=None,
+                upside_pct=None,
+                confidence="N/A",
+                notes="Needs positive EPS and growth"
             ))
-            
-            return fair_value
-            
-        except Exception as e:
             return None
+        
+        # Convert growth to percentage if needed
+        if growth_rate < 1:
+            growth_pct = growth_rate * 100
+        else:
+            growth_pct = growth_rate
+        
+        # Peter Lynch: Fair PE = Growth Rate
+        # A 20% grower deserves 20x PE
+        fair_pe = min(growth_pct, 30)  # Cap at 30x
+        fair_value = eps * fair_pe
+        
+        upside = self._upside(fair_value)
+        
+        self.results.append(ValuationResult(
+            method="PEG-Based",
+            fair_value=fair_value,
+            upside_pct=upside,
+            confidence="Medium",
+            notes=f"Growth: {growth_pct:.0f}% → Fair PE: {fair_pe:.0f}x"
+        ))
+        
+        return fair_value
     
     def format_report(self, summary: ValuationSummary) -> str:
         """Format valuation report for display."""